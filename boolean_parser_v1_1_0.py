@@ -24,6 +24,7 @@
 # ============================================================================
 
 import re
+from functools import lru_cache
 
 # ============================================================================
 # OPERATOR MAPPING - Normalize different language operators
@@ -31,6 +32,11 @@ import re
 # This dictionary maps various operator representations to standard English.
 # Supports both English and German operators for international users.
 # Example: "und" in German becomes "AND" internally
+#
+# Only the exact spellings listed here are operators. Mixed case such as
+# "And" or "Oder" stays a search term, so the map is deliberately not
+# case-folded: one exact-match dict lookup per token is both the fastest
+# check and the documented behaviour.
 # ============================================================================
 
 OPERATOR_MAP = {
@@ -50,6 +56,82 @@ OPERATOR_MAP = {
     'NOT': 'NOT',
 }
 
+# All operator spellings, for a single hash lookup in is_operator()
+# and is_valid_operator_line().
+# Every value in OPERATOR_MAP is AND, OR or NOT, so a token is an
+# operator exactly when it is one of the keys.
+_OPERATOR_KEYS = frozenset(OPERATOR_MAP)
+
+# The two quote characters, for startswith() and membership tests
+_QUOTES = ('"', "'")
+
+# The two parenthesis tokens
+_PARENS = frozenset('()')
+
+# Format codes used inside parse_query() (see _DISPATCH at the end of
+# the file); _FORMAT_NAMES holds the public name for each code
+_FORMAT_SINGLE = 0
+_FORMAT_MULTI = 1
+_FORMAT_UNKNOWN = 2
+_FORMAT_NAMES = ('SINGLE_LINE', 'MULTI_LINE', 'UNKNOWN')
+
+
+# ============================================================================
+# PRECOMPILED PATTERNS
+# ============================================================================
+# Compiled once at import time. Scanning a string with a compiled pattern
+# runs in the regex engine's C code instead of a Python loop per character.
+# ============================================================================
+
+# Field-term: quoted content + non-empty field code in brackets.
+# The closing quote is the first quote of the same type, and the field code
+# runs up to the first ] which must end the token (used with fullmatch).
+# Example: "cancer"[MeSH]
+_FIELD_TERM_RE = re.compile(r'(?:"[^"]*"|\'[^\']*\')\[[^\]]+\]')
+
+# Line prefix before an inline comment: any run of non-special characters
+# and quoted parts. A quote that is never closed runs to the end of the
+# line, so a # inside it is not a comment. The match stops at the first
+# # outside of quotes (or at the end of the line).
+_COMMENT_RE = re.compile(r'''(?:[^#"']+|"[^"]*(?:"|\Z)|'[^']*(?:'|\Z))*''')
+
+# Token scanner used by tokenize(). A token is either a single parenthesis
+# or a run of the following parts (only spaces and parentheses split tokens):
+# [^ ()"']+                     = Ordinary characters
+# "[^"]*(?:"(?:\[[^\]]*\]?)?)?  = Quoted part, optionally followed directly
+#                                 by a field code like [MeSH]
+# '[^']*(?:'(?:\[[^\]]*\]?)?)?  = Same for single quotes
+# An unclosed quote or bracket runs to the end of the query.
+_TOKEN_PARTS = (
+    r'(?:[^ ()"\']+'
+    r'|"[^"]*(?:"(?:\[[^\]]*\]?)?)?'
+    r"|'[^']*(?:'(?:\[[^\]]*\]?)?)?)+"
+)
+_TOKEN_RE = re.compile(r'[()]|' + _TOKEN_PARTS)
+
+# Whole-query validator used by validate_single_line(). It walks the query
+# token by token in one regex pass and only succeeds if every token is valid:
+# [ ()]             = One space or parenthesis between tokens. Runs of them
+#                     are taken one character at a time: with [ ()]+ inside
+#                     the outer (...)* a failing match would try every way to
+#                     split a run of spaces (exponential backtracking).
+# word              = Any token that doesn't start with a quote (operators
+#                     and simple terms are always valid)
+# "field"[code]     = A complete field-term (at least 6 characters)
+# "quoted phrase"   = A token that starts and ends with the same quote
+# (?=(...))\N is the usual trick to take a whole token at once, exactly as
+# tokenize() would, without the engine trying shorter splits of it.
+_TOKEN_END = r'(?=[ ()]|\Z)'
+_VALID_QUERY_RE = re.compile(
+    r'(?:[ ()]'
+    r'|(?=[^ ()"\'])(?=(' + _TOKEN_PARTS + r'))\1'
+    r'|(?!""\[[^\]]\]' + _TOKEN_END + r')"[^"]*"\[[^\]]+\]' + _TOKEN_END +
+    r"|(?!''\[[^\]]\]" + _TOKEN_END + r")'[^']*'\[[^\]]+\]" + _TOKEN_END +
+    r'|(?!"\Z)(?=")(?=(' + _TOKEN_PARTS + r'))\2(?<=")'
+    r"|(?!'\Z)(?=')(?=(" + _TOKEN_PARTS + r"))\3(?<=')"
+    r')*'
+)
+
 
 # ============================================================================
 # MAIN PARSER FUNCTION
@@ -90,56 +172,88 @@ def parse_query(query):
     True
     >>> result['format']
     'MULTI_LINE'
+    
+    NOTE:
+    Results are cached per query text (see _parse_query_cached below);
+    clear_caches() empties the cache.
     """
     
-    # Remove comments and clean the query
-    cleaned_query = preprocess(query)
-    if not cleaned_query:
-        return {
-            'success': False,
-            'format': 'UNKNOWN',
-            'output': '',
-            'error': 'Query is empty or only contains comments'
-        }
+    success, format_type, output, error = _parse_query_cached(query)
+    result = {'success': success, 'format': format_type, 'output': output}
+    if error is not None:
+        result['error'] = error
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _parse_query_cached(query):
+    """
+    Does the actual work for parse_query(); results are cached by query text.
+    
+    WHAT THIS DOES:
+    Runs preprocess -> detect format -> validate -> parse and returns the
+    result as an immutable tuple (success, format, output, error), so it
+    can be cached. parse_query() builds a fresh dict from it on every call.
+    
+    WHY IT MATTERS:
+    Interactive callers re-validate the same query again and again
+    (e.g. on every keystroke); repeated queries skip all parsing work.
+    """
+    
+    # Remove comments and clean the query. The query is split into
+    # lines once here; the multi-line steps below work on that list.
+    lines = _preprocess_lines(query)
+    if not lines:
+        return (False, 'UNKNOWN', '',
+                'Query is empty or only contains comments')
     
     # Determine if single-line or multi-line format
-    format_type = detect_format(cleaned_query)
-    
-    if format_type == 'MULTI_LINE':
-        if not validate_multiline(cleaned_query):
-            return {
-                'success': False,
-                'format': 'MULTI_LINE',
-                'output': cleaned_query,
-                'error': 'Multi-line format validation failed'
-            }
-        return {
-            'success': True,
-            'format': 'MULTI_LINE',
-            'output': parse_multiline(cleaned_query)
-        }
-    
-    elif format_type == 'SINGLE_LINE':
-        if not validate_single_line(cleaned_query):
-            return {
-                'success': False,
-                'format': 'SINGLE_LINE',
-                'output': cleaned_query,
-                'error': 'Single-line format validation failed'
-            }
-        return {
-            'success': True,
-            'format': 'SINGLE_LINE',
-            'output': parse_single_line(cleaned_query)
-        }
+    format_code = _format_code(len(lines))
+    if format_code == _FORMAT_UNKNOWN:
+        return (False, 'UNKNOWN', '\n'.join(lines),
+                'Could not determine query format')
     
-    else:
-        return {
-            'success': False,
-            'format': 'UNKNOWN',
-            'output': cleaned_query,
-            'error': 'Could not determine query format'
-        }
+    # Validate and parse with the functions for this format
+    validate, parse, format_type, error = _DISPATCH[format_code]
+    if not validate(lines):
+        return (False, format_type, '\n'.join(lines), error)
+    return (True, format_type, parse(lines), None)
+
+
+def clear_caches():
+    """
+    Empty the parse_query() result cache.
+    
+    WHAT THIS DOES:
+    Drops every cached result, e.g. between benchmark runs or tests.
+    """
+    _parse_query_cached.cache_clear()
+
+
+def parse_queries(queries):
+    """
+    Parse many queries at once, e.g. a saved-query library in CI.
+    
+    WHAT THIS DOES:
+    Returns the same result dicts as calling parse_query() on each query,
+    in input order.
+    
+    WHY IT MATTERS:
+    CI jobs can check a whole saved-query library with one call.
+    Libraries repeat the same queries a lot, and repeats are answered
+    from the parse_query() cache (see _parse_query_cached()).
+    
+    PARAMETERS:
+    queries (list): Raw query strings
+    
+    RETURNS:
+    list: One result dict per query (see parse_query())
+    
+    EXAMPLES:
+    >>> [r['output'] for r in parse_queries(['a und b', '(x oder y)'])]
+    ['a AND b', '( x OR y )']
+    """
+    return [parse_query(query) for query in queries]
 
 
 # ============================================================================
@@ -168,7 +282,22 @@ def preprocess(query):
     >>> preprocess('cancer # search term\\nAND treatment')
     'cancer\\nAND treatment'
     """
+    return '\n'.join(_preprocess_lines(query))
+
+
+def _preprocess_lines(query):
+    """
+    Same as preprocess(), but returns the cleaned lines as a list.
+    parse_query() keeps working on this list instead of splitting
+    the cleaned query again in every later step.
+    """
     lines = query.split('\n')
+    
+    # No # anywhere in the query: no comments to remove on any line,
+    # only blank lines to skip
+    if '#' not in query:
+        return [line for line in lines if line.strip()]
+    
     cleaned_lines = []
     
     for line in lines:
@@ -178,7 +307,7 @@ def preprocess(query):
         if line.strip():
             cleaned_lines.append(line)
     
-    return '\n'.join(cleaned_lines)
+    return cleaned_lines
 
 
 def remove_inline_comment(line):
@@ -186,16 +315,14 @@ def remove_inline_comment(line):
     Remove Python-style comment from a single line.
     Respects quotes - doesn't remove # inside quoted strings.
     """
-    in_single_quote = False
-    in_double_quote = False
+    # Fast path: no # at all, nothing to remove
+    if '#' not in line:
+        return line
     
-    for i, char in enumerate(line):
-        if char == '"' and not in_single_quote:
-            in_double_quote = not in_double_quote
-        elif char == "'" and not in_double_quote:
-            in_single_quote = not in_single_quote
-        elif char == '#' and not in_single_quote and not in_double_quote:
-            return line[:i].rstrip()
+    # The pattern stops at the first # outside of quotes
+    end = _COMMENT_RE.match(line).end()
+    if end < len(line):
+        return line[:end].rstrip()
     
     return line
 
@@ -230,15 +357,20 @@ def detect_format(query):
     >>> detect_format('(cancer)\\nAND\\n(treatment)')
     'MULTI_LINE'
     """
-    lines = query.strip().split('\n')
-    
-    if len(lines) == 1:
-        return 'SINGLE_LINE'
+    # Only the number of lines matters, so count line breaks
+    # instead of building a list of all lines
+    return _FORMAT_NAMES[_format_code(query.strip().count('\n') + 1)]
+
+
+def _format_code(line_count):
+    """Format code (_FORMAT_*) for a query with the given number of lines."""
+    if line_count == 1:
+        return _FORMAT_SINGLE
     
-    if len(lines) >= 3 and len(lines) % 2 == 1:
-        return 'MULTI_LINE'
+    if line_count >= 3 and line_count % 2 == 1:
+        return _FORMAT_MULTI
     
-    return 'UNKNOWN'
+    return _FORMAT_UNKNOWN
 
 
 # ============================================================================
@@ -272,12 +404,22 @@ def validate_multiline(query):
     >>> validate_multiline('(cancer)\\nAND')  # Missing final content
     False
     """
-    lines = query.strip().split('\n')
+    query = query.strip()
     
-    # Must have odd number of lines
-    if len(lines) < 3 or len(lines) % 2 == 0:
+    # Must have odd number of lines - checked on the line break count
+    # before splitting, so wrong shapes are rejected without a list
+    line_count = query.count('\n') + 1
+    if line_count < 3 or line_count % 2 == 0:
         return False
     
+    return _validate_multiline_lines(query.split('\n'))
+
+
+def _validate_multiline_lines(lines):
+    """
+    Validate the lines of a multi-line query (see validate_multiline()).
+    The caller has already checked that there are 3+ lines, odd count.
+    """
     # Validate each line
     for i, line in enumerate(lines):
         if i % 2 == 0:  # Even index = content line
@@ -292,8 +434,9 @@ def validate_multiline(query):
 
 def is_valid_operator_line(line):
     """Check if a line contains a valid operator (AND, OR, NOT)."""
-    operator = normalize_operators(line)
-    return operator in ['AND', 'OR', 'NOT']
+    # Same check as is_operator(): a line normalizes to AND/OR/NOT
+    # exactly when it is one of the operator spellings
+    return line in _OPERATOR_KEYS
 
 
 # ============================================================================
@@ -329,32 +472,18 @@ def validate_single_line(query):
     >>> validate_single_line('"cancer"[MeSH] AND treatment')
     True
     
-    >>> validate_single_line('cancer [INVALID]')
+    >>> validate_single_line('"cancer" "[INVALID]')
     False
     """
-    tokens = tokenize(query)
-    
-    for token in tokens:
-        if is_operator(token):
-            # Operators are valid
-            continue
-        elif is_quoted_phrase(token):
-            # Quoted phrases without field codes are valid
-            continue
-        elif is_field_term(token):
-            # Field-specific terms are valid (NEW in v1.1.0)
-            continue
-        elif is_parenthesis(token):
-            # Parentheses are valid
-            continue
-        elif is_simple_term(token):
-            # Simple terms are valid
-            continue
-        else:
-            # Unknown token type - invalid
-            return False
+    # Fast path: every token that doesn't start with a quote is an
+    # operator, a parenthesis or a simple term - all of them valid.
+    # So a query without quotes is valid as a whole, no tokens needed.
+    if '"' not in query and "'" not in query:
+        return True
     
-    return True
+    # Queries with quotes: check all tokens in one pass of the
+    # precompiled validator (see _VALID_QUERY_RE above)
+    return _VALID_QUERY_RE.fullmatch(query) is not None
 
 
 # ============================================================================
@@ -434,71 +563,14 @@ def is_field_term(token):
     8. Return True if all checks pass
     """
     
-    # STEP 1: Minimum length check
-    # Smallest valid field-term is "a"[b] which is 6 characters
-    if len(token) < 6:
-        return False
-    
-    # STEP 2: Opening quote check
-    # Must start with either double quote (") or single quote (')
-    if token[0] not in ['"', "'"]:
-        return False
-    
-    # Store which type of quote we found (to match closing quote)
-    quote_type = token[0]
-    
-    # STEP 3: Find closing quote
-    # Search for the matching closing quote starting after position 0
-    closing_quote_pos = -1
-    for i in range(1, len(token)):
-        if token[i] == quote_type:
-            closing_quote_pos = i
-            break
-    
-    # If no closing quote found, not a valid field-term
-    if closing_quote_pos == -1:
-        return False
-    
-    # STEP 4: Check for opening bracket [
-    # The next character after the closing quote MUST be [
-    if closing_quote_pos + 1 >= len(token):
-        # Token ends right after closing quote, no bracket possible
-        return False
-    
-    if token[closing_quote_pos + 1] != '[':
-        # Next character isn't [, so not a field-term
-        return False
-    
-    # STEP 5: Find closing bracket ]
-    # Search for ] after the opening bracket
-    closing_bracket_pos = -1
-    for i in range(closing_quote_pos + 2, len(token)):
-        if token[i] == ']':
-            closing_bracket_pos = i
-            break
-    
-    # If no closing bracket found, not a valid field-term
-    if closing_bracket_pos == -1:
-        return False
-    
-    # STEP 6: Verify field code is not empty
-    # Calculate field code length (between [ and ])
-    # We found [ at position (closing_quote_pos + 1)
-    # Field code starts at (closing_quote_pos + 2) and ends before closing_bracket_pos
-    field_code_length = closing_bracket_pos - (closing_quote_pos + 2)
-    
-    if field_code_length < 1:
-        # Empty field code like "term"[]
-        return False
-    
-    # STEP 7: Verify nothing after closing bracket
-    # The closing bracket should be the LAST character in the token
-    if closing_bracket_pos != len(token) - 1:
-        # Extra characters after bracket like "term"[field]extra
+    # STEP 1: Minimum length and last character check
+    # Smallest valid field-term is "a"[b] which is 6 characters, and every
+    # field-term ends with ] - this rejects most tokens without the regex
+    if len(token) < 6 or token[-1] != ']':
         return False
     
-    # STEP 8: All checks passed - this IS a field-term!
-    return True
+    # STEPS 2-7: One precompiled pattern (see _FIELD_TERM_RE above)
+    return _FIELD_TERM_RE.fullmatch(token) is not None
 
 
 # ============================================================================
@@ -507,7 +579,7 @@ def is_field_term(token):
 
 def is_operator(token):
     """Check if token is an operator (AND, OR, NOT)."""
-    return normalize_operators(token) in ['AND', 'OR', 'NOT']
+    return token in _OPERATOR_KEYS
 
 
 def is_quoted_phrase(token):
@@ -532,19 +604,16 @@ def is_quoted_phrase(token):
     if len(token) < 2:
         return False
     
-    # Check for matching quotes (not field-terms)
-    if (token[0] == '"' and token[-1] == '"') or \
-       (token[0] == "'" and token[-1] == "'"):
-        # It's quoted, but make sure it's not a field-term
-        # (field-terms have brackets after the quote)
-        return not is_field_term(token)
-    
-    return False
+    # Check for matching quotes. This already rules out field-terms:
+    # they always end with ] and never with a quote, so there is no
+    # need to run is_field_term() here as well
+    quote = token[0]
+    return quote in _QUOTES and token[-1] == quote
 
 
 def is_parenthesis(token):
     """Check if token is a parenthesis: ( or )"""
-    return token in ['(', ')']
+    return token in _PARENS
 
 
 def is_simple_term(token):
@@ -563,23 +632,18 @@ def is_simple_term(token):
     False  # Quoted terms are not simple terms
     """
     # Must have at least 1 character
-    if len(token) == 0:
-        return False
-    
-    # Cannot be an operator
-    if is_operator(token):
+    if not token:
         return False
     
-    # Cannot be a parenthesis
-    if is_parenthesis(token):
+    # Cannot be a quoted phrase - decided by the first character alone,
+    # so quoted tokens skip the operator and parenthesis lookups below
+    if token.startswith(_QUOTES):
         return False
     
-    # Cannot be a quoted phrase
-    if token[0] in ['"', "'"]:
-        return False
-    
-    # Anything else is a simple term
-    return True
+    # Cannot be an operator or a parenthesis (same set lookups as
+    # is_operator() and is_parenthesis(), without the function calls).
+    # Anything else is a simple term.
+    return token not in _OPERATOR_KEYS and token not in _PARENS
 
 
 # ============================================================================
@@ -610,45 +674,12 @@ def tokenize(query):
     
     >>> tokenize('"cancer phrase" AND treatment')
     ['"cancer phrase"', 'AND', 'treatment']
+    
+    >>> tokenize('"cancer"[MeSH] AND treatment')
+    ['"cancer"[MeSH]', 'AND', 'treatment']
     """
-    tokens = []
-    current_token = ''
-    in_quote = False
-    quote_char = None
-    
-    for i, char in enumerate(query):
-        if char in ['"', "'"] and not in_quote:
-            in_quote = True
-            quote_char = char
-            current_token += char
-        elif char == quote_char and in_quote:
-            in_quote = False
-            current_token += char
-            # Check if followed by [ for field-term
-            if i + 1 < len(query) and query[i + 1] == '[':
-                # Continue to collect the field code
-                j = i + 1
-                while j < len(query) and query[j] != ']':
-                    current_token += query[j]
-                    j += 1
-                if j < len(query):
-                    current_token += query[j]  # Add closing ]
-        elif char in ['(', ')'] and not in_quote:
-            if current_token:
-                tokens.append(current_token)
-                current_token = ''
-            tokens.append(char)
-        elif char == ' ' and not in_quote:
-            if current_token:
-                tokens.append(current_token)
-                current_token = ''
-        else:
-            current_token += char
-    
-    if current_token:
-        tokens.append(current_token)
-    
-    return tokens
+    # One pass of the precompiled scanner (see _TOKEN_RE above)
+    return _TOKEN_RE.findall(query)
 
 
 # ============================================================================
@@ -669,7 +700,11 @@ def parse_multiline(query):
     RETURNS:
     str: Normalized query with standard operators
     """
-    lines = query.strip().split('\n')
+    return _parse_multiline_lines(query.strip().split('\n'))
+
+
+def _parse_multiline_lines(lines):
+    """Parse the lines of a validated multi-line query (see parse_multiline())."""
     result = []
     
     for i, line in enumerate(lines):
@@ -695,16 +730,22 @@ def parse_single_line(query):
     RETURNS:
     str: Normalized query with standard operators
     """
-    tokens = tokenize(query)
-    normalized_tokens = [normalize_operators(t) if is_operator(t) else t for t in tokens]
-    
-    # Reconstruct with proper spacing
-    result = ' '.join(normalized_tokens)
+    if '"' not in query and "'" not in query:
+        # Fast path: without quotes only spaces and parentheses split
+        # tokens, so plain string methods can do the tokenizing
+        spaced = query.replace('(', ' ( ').replace(')', ' ) ')
+        tokens = [token for token in spaced.split(' ') if token]
+    else:
+        tokens = tokenize(query)
     
-    # Handle unfold parentheses if needed
-    result = unfold_parens(result)
+    # Normalize every operator in one pass: OPERATOR_MAP.get(token, token)
+    # maps operator spellings and returns all other tokens unchanged,
+    # and map() runs that lookup without a Python loop per token
+    normalized_tokens = map(OPERATOR_MAP.get, tokens, tokens)
     
-    return result
+    # Reconstruct with proper spacing
+    # (unfold_parens() is still a no-op placeholder, so it isn't called)
+    return ' '.join(normalized_tokens)
 
 
 # ============================================================================
@@ -761,3 +802,30 @@ def unfold_parens(query):
     # - Flatten unnecessary nesting
     # For now, return unchanged
     return query
+
+
+# ============================================================================
+# FORMAT DISPATCH
+# ============================================================================
+# parse_query() looks up the validator and parser for a format code here
+# instead of comparing format names. All entries take the list of cleaned
+# lines; a single-line query is the only element of its list.
+# ============================================================================
+
+def _validate_single_line_lines(lines):
+    """validate_single_line() for the one-line list from parse_query()."""
+    return validate_single_line(lines[0])
+
+
+def _parse_single_line_lines(lines):
+    """parse_single_line() for the one-line list from parse_query()."""
+    return parse_single_line(lines[0])
+
+
+# _DISPATCH[format_code] -> (validator, parser, format name, error message)
+_DISPATCH = (
+    (_validate_single_line_lines, _parse_single_line_lines,
+     'SINGLE_LINE', 'Single-line format validation failed'),
+    (_validate_multiline_lines, _parse_multiline_lines,
+     'MULTI_LINE', 'Multi-line format validation failed'),
+)
@@ -31,7 +31,111 @@
 # ============================================================================
 
 import re
-from typing import List, Dict, Tuple, Optional
+import sys
+from functools import lru_cache
+from itertools import product
+from typing import List, Dict, Tuple, Optional, Iterable
+
+
+# ============================================================================
+# PRECOMPILED PATTERNS
+# ============================================================================
+# Compiled once at import time, so the validators don't go through the
+# re module's pattern cache for every single token.
+# ============================================================================
+
+# Field-term: "text"[fieldcode] or 'text'[fieldcode]
+# ^                    = start of string
+# ([\"'])              = capture group 1: either " or ' (note: escaped quotes)
+# (.+?)                = capture group 2: one or more chars (non-greedy)
+# \1                   = backreference: must match same quote as group 1
+# \[                   = literal [ (escaped)
+# ([A-Za-z0-9_]+)      = capture group 3: field code (alphanumeric + _)
+# \]                   = literal ] (escaped)
+# $                    = end of string
+_FIELD_TERM_RE = re.compile(r'^([\"\'])(.+?)\1\[([A-Za-z0-9_]+)\]$')
+
+# Regular term: word characters, hyphens, numbers
+_REGULAR_TERM_RE = re.compile(r'^[A-Za-z0-9_\-]+$')
+
+# Token scanner used by tokenize(). One alternative per token type:
+# "[^"]*(?:"(?:\[[^\]]*\]?)?)?  = Quoted string, optionally followed directly
+#                                 by a field code like [MeSH]
+# '[^']*(?:'(?:\[[^\]]*\]?)?)?  = Same for single quotes
+# \[[^\]]*\]?                   = Bracket without a quoted term
+# [()]                          = Parenthesis
+# [^\s()"'\[]+                  = Run of regular characters
+# An unclosed quote or bracket runs to the end of the query.
+_QUOTED_TOKEN = r'"[^"]*(?:"(?:\[[^\]]*\]?)?)?' r"|'[^']*(?:'(?:\[[^\]]*\]?)?)?"
+_BRACKET_TOKEN = r'\[[^\]]*\]?'
+_WORD_TOKEN = r'[^\s()"\'\[]+'
+_TOKEN_RE = re.compile(_QUOTED_TOKEN + '|' + _BRACKET_TOKEN + r'|[()]|' + _WORD_TOKEN)
+
+# Same scanner with one named group per token type, used by _scan_tokens().
+# A well-formed field-term is tried first; it always covers exactly the same
+# text as the quoted alternative would, so both patterns split a query into
+# the same tokens.
+_KIND_TOKEN_RE = re.compile(
+    r'(?P<fieldterm>"[^"\n]+"\[[A-Za-z0-9_]+\]' r"|'[^'\n]+'\[[A-Za-z0-9_]+\])"
+    r'|(?P<quoted>' + _QUOTED_TOKEN + ')'
+    r'|(?P<bracket>' + _BRACKET_TOKEN + ')'
+    r'|(?P<open_paren>\()'
+    r'|(?P<close_paren>\))'
+    r'|(?P<word>' + _WORD_TOKEN + ')'
+)
+
+
+# ============================================================================
+# VALIDATION TABLES
+# ============================================================================
+
+def _case_variants(words):
+    """Every upper/lower case spelling of the given words (AND, And, aNd, ...)."""
+    return frozenset(''.join(chars)
+                     for word in words
+                     for chars in product(*zip(word.upper(), word.lower())))
+
+
+# Operators accepted by validate_single_line(), in any case. Looking the
+# token up directly saves a .upper() copy per token. (The old check was
+# token.upper() in {'AND', 'OR', 'NOT', 'und', 'oder', 'nicht'}, where the
+# lowercase German words could never match - so they are not included.)
+_OPERATORS_ANYCASE = _case_variants(('AND', 'OR', 'NOT'))
+
+# get_query_info() also counts the German operators, in any case
+_INFO_OPERATORS_ANYCASE = _OPERATORS_ANYCASE | _case_variants(('UND', 'ODER', 'NICHT'))
+
+# One shared (interned) string object per operator spelling. Operators
+# repeat in every query, so tokenize() hands out these instead of a new
+# copy each time - the cached token tuples then share them, and string
+# comparisons against them can stop at the identity check. (Single
+# characters like ( and ) are shared by Python already.)
+_INTERNED = {op: sys.intern(op) for op in _INFO_OPERATORS_ANYCASE}
+
+# Token types used by _scan_tokens() and validate_single_line().
+# _START is the state before the first token.
+_OPERAND, _OPERATOR, _OPEN_PAREN, _CLOSE_PAREN, _START, _INVALID = range(6)
+
+# Token type for the _KIND_TOKEN_RE groups that need no further checks
+_GROUP_KINDS = {
+    'fieldterm': _OPERAND,
+    'bracket': _INVALID,        # field code without quoted term
+    'open_paren': _OPEN_PAREN,
+    'close_paren': _CLOSE_PAREN,
+}
+
+# Allowed previous token types, indexed by the current token type.
+# Operands and opening parens follow an operator, an opening paren or
+# start the query; operators and closing parens follow an operand or a
+# closing paren. Nothing may precede an invalid token.
+_LEGAL_PREV = (
+    frozenset({_OPERATOR, _OPEN_PAREN, _START}),    # _OPERAND
+    frozenset({_OPERAND, _CLOSE_PAREN}),            # _OPERATOR
+    frozenset({_OPERATOR, _OPEN_PAREN, _START}),    # _OPEN_PAREN
+    frozenset({_OPERAND, _CLOSE_PAREN}),            # _CLOSE_PAREN
+    frozenset(),                                    # _START
+    frozenset(),                                    # _INVALID
+)
 
 
 # ============================================================================
@@ -73,17 +177,14 @@ def is_field_term(token: str) -> bool:
     - Field code can be alphanumeric and underscore
     - Must have non-empty quoted content and field code
     """
-    # Pattern explanation:
-    # ^                    = start of string
-    # ([\"'])              = capture group 1: either " or ' (note: escaped quotes)
-    # (.+?)                = capture group 2: one or more chars (non-greedy)
-    # \1                   = backreference: must match same quote as group 1
-    # \[                   = literal [ (escaped)
-    # ([A-Za-z0-9_]+)      = capture group 3: field code (alphanumeric + _)
-    # \]                   = literal ] (escaped)
-    # $                    = end of string
-    pattern = r'^([\"\'])(.+?)\1\[([A-Za-z0-9_]+)\]$'
-    return bool(re.match(pattern, token))
+    # Fast path: a field-term ends with ] (the $ of the pattern also allows
+    # one trailing newline). Most tokens are plain words or "phrases" and
+    # are rejected here without starting the regex engine.
+    if ']' not in token[-2:]:
+        return False
+    
+    # Pattern explanation: see _FIELD_TERM_RE at the top of the file
+    return _FIELD_TERM_RE.match(token) is not None
 
 
 def tokenize(query: str) -> List[str]:
@@ -117,98 +218,81 @@ def tokenize(query: str) -> List[str]:
     List[str]: List of individual tokens
     
     ALGORITHM:
-    1. Find all quoted strings (single or double quoted)
-    2. Find all field-terms ("text"[fieldcode])
-    3. Split remaining content by whitespace
-    4. Keep parentheses and operators as separate tokens
+    One pass of _TOKEN_RE over the query. Each alternative of the pattern
+    is one token type (quoted string/field-term, bracket, parenthesis,
+    word); whitespace between tokens is simply skipped.
+    
+    NOTE:
+    Results are cached per query text (see _tokenize_cached below);
+    every call still gets its own list.
+    """
+    return list(_tokenize_cached(query))
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_cached(query: str) -> Tuple[str, ...]:
     """
-    tokens = []
-    i = 0
-    current_token = ""
+    Does the actual work for tokenize(); results are cached by query text.
     
-    while i < len(query):
-        char = query[i]
-        
-        # Handle quoted strings and field-terms
-        if char in ('"', "'"):
-            quote = char
-            # Collect the quoted string + any following [fieldcode]
-            quoted_part = char
-            i += 1
-            
-            # Collect characters until closing quote
-            while i < len(query) and query[i] != quote:
-                quoted_part += query[i]
-                i += 1
-            
-            if i < len(query):
-                quoted_part += query[i]  # Add closing quote
-                i += 1
-            
-            # Check if there's a field code after the quote
-            if i < len(query) and query[i] == '[':
-                bracket_part = "["
-                i += 1
-                while i < len(query) and query[i] != ']':
-                    bracket_part += query[i]
-                    i += 1
-                if i < len(query):
-                    bracket_part += query[i]  # Add closing ]
-                    i += 1
-                quoted_part += bracket_part
-            
-            # This is a complete token (quoted string or field-term)
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-            tokens.append(quoted_part)
-        
-        # Handle parentheses - these are always separate tokens
-        elif char in "()":
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-            tokens.append(char)
-            i += 1
-        
-        # Handle whitespace - marks end of token
-        elif char.isspace():
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-            i += 1
-        
-        # Handle brackets (for field codes without quotes)
-        elif char == '[':
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-            bracket_token = "["
-            i += 1
-            while i < len(query) and query[i] != ']':
-                bracket_token += query[i]
-                i += 1
-            if i < len(query):
-                bracket_token += query[i]
-                i += 1
-            tokens.append(bracket_token)
-        
-        # Regular character - add to current token
-        else:
-            current_token += char
-            i += 1
+    Returns an immutable tuple so the cached value can't be changed by a
+    caller that modifies its token list.
+    """
+    # Fast path: without quotes or brackets the only tokens are parentheses
+    # and whitespace-separated words, which plain string methods split
+    # several times faster than the regex scan
+    if '"' not in query and "'" not in query and '[' not in query:
+        tokens = query.replace('(', ' ( ').replace(')', ' ) ').split()
+    else:
+        tokens = _TOKEN_RE.findall(query)
     
-    # Don't forget the last token
-    if current_token:
-        tokens.append(current_token)
+    # Swap operators for their shared copy (see _INTERNED)
+    return tuple(map(_INTERNED.get, tokens, tokens))
+
+
+def _scan_tokens(query: str):
+    """
+    Tokenize a query and classify every token in the same pass.
     
-    return tokens
+    WHAT THIS DOES:
+    Yields (token_type, token) pairs. The token type comes from the
+    _KIND_TOKEN_RE group that matched, so validation doesn't have to run
+    is_field_term() and the other checks on every token again.
+    
+    PARAMETERS:
+    query (str): The query string to scan
+    
+    RETURNS:
+    Iterator of (int, str): token type and token. The token type is one of
+    _OPERAND, _OPERATOR, _OPEN_PAREN, _CLOSE_PAREN or _INVALID
+    (bare [fieldcode], unclosed quotes, unknown characters).
+    """
+    for match in _KIND_TOKEN_RE.finditer(query):
+        group = match.lastgroup
+        token = match.group()
+        if group == 'word':
+            if token in _OPERATORS_ANYCASE:
+                kind = _OPERATOR
+                token = _INTERNED[token]
+            elif _REGULAR_TERM_RE.match(token):
+                kind = _OPERAND
+            else:
+                kind = _INVALID
+        elif group == 'quoted':
+            # "text" (closed quote) or an unusual field-term like "a"[b"[c]
+            if token[-1] == token[0] or is_field_term(token):
+                kind = _OPERAND
+            else:
+                kind = _INVALID
+        else:
+            kind = _GROUP_KINDS[group]
+        yield kind, token
 
 
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=1024)
 def validate_single_line(query: str) -> bool:
     """
     Validate a single-line boolean query.
@@ -253,91 +337,100 @@ def validate_single_line(query: str) -> bool:
     if not query:
         return False
     
-    tokens = tokenize(query)
+    return _validate_tokens(_scan_tokens(query))[0]
+
+
+def _validate_tokens(tokens: Iterable[Tuple[int, str]]) -> Tuple[bool, Optional[str]]:
+    """
+    Check scanned tokens and say why they are invalid.
+    
+    WHAT THIS DOES:
+    Runs the checks of validate_single_line() on the (token type, token)
+    pairs from _scan_tokens(). Stops at the first problem and returns its
+    error message, so parse_query() doesn't have to tokenize again to
+    find out what went wrong.
     
-    if not tokens:
-        return False
+    Token order and parenthesis balance are checked in the same single
+    pass, so the tokens can also come straight from the _scan_tokens()
+    generator and scanning stops at the first invalid token.
     
-    # Check for balanced parentheses
+    PARAMETERS:
+    tokens (Iterable[Tuple[int, str]]): Output of _scan_tokens()
+    
+    RETURNS:
+    Tuple[bool, Optional[str]]: (True, None) if valid,
+    otherwise (False, error message)
+    """
     paren_count = 0
-    for token in tokens:
-        if token == '(':
+    prev_token_type = _START
+    prev_token = None
+    
+    for kind, token in tokens:
+        # Check token sequence validity (see _LEGAL_PREV)
+        if prev_token_type not in _LEGAL_PREV[kind]:
+            return False, _sequence_error(prev_token_type, prev_token, kind, token)
+        
+        # Check for balanced parentheses
+        if kind == _OPEN_PAREN:
             paren_count += 1
-        elif token == ')':
+        elif kind == _CLOSE_PAREN:
             paren_count -= 1
             if paren_count < 0:
-                return False
+                return False, "Closing parenthesis without opening parenthesis"
+        
+        prev_token_type = kind
+        prev_token = token
     
-    if paren_count != 0:
-        return False
+    if prev_token_type == _START:
+        return False, 'Query is empty'
     
-    # Check token sequence validity
-    valid_operators = {'AND', 'OR', 'NOT', 'und', 'oder', 'nicht'}
+    # Last token must be operand or closing paren
+    if prev_token_type == _OPERATOR:
+        return False, f"Query cannot end with operator: {prev_token}"
     
-    prev_token_type = None  # 'operand', 'operator', 'open_paren', 'close_paren'
+    # (This also catches a query ending with an opening paren)
+    if paren_count != 0:
+        return False, f"Missing closing parenthesis ({paren_count} unclosed)"
     
-    for i, token in enumerate(tokens):
-        token_upper = token.upper()
-        
-        if token == '(':
-            # Opening paren can follow operator, another opening paren, or be first
-            if prev_token_type not in (None, 'operator', 'open_paren'):
-                return False
-            prev_token_type = 'open_paren'
-        
-        elif token == ')':
-            # Closing paren can only follow operand or another closing paren
-            if prev_token_type not in ('operand', 'close_paren'):
-                return False
-            prev_token_type = 'close_paren'
-        
-        elif token_upper in valid_operators:
-            # Operator cannot follow another operator or opening paren, or be first/last
-            if prev_token_type is None or prev_token_type in ('operator', 'open_paren'):
-                return False
-            if i == len(tokens) - 1:  # Last token
-                return False
-            prev_token_type = 'operator'
-        
-        else:
-            # This is an operand (term or field-term)
-            # Check if it's a valid field-term or regular term
-            
-            # Field-term: "text"[fieldcode]
-            if is_field_term(token):
-                if prev_token_type not in (None, 'operator', 'open_paren'):
-                    return False
-                prev_token_type = 'operand'
-            
-            # Quoted string without field code: "text"
-            elif (token.startswith('"') and token.endswith('"')) or \
-                 (token.startswith("'") and token.endswith("'")):
-                if prev_token_type not in (None, 'operator', 'open_paren'):
-                    return False
-                prev_token_type = 'operand'
-            
-            # Regular term: word characters, hyphens, numbers
-            elif re.match(r'^[A-Za-z0-9_\-]+$', token):
-                if prev_token_type not in (None, 'operator', 'open_paren'):
-                    return False
-                prev_token_type = 'operand'
-            
-            # Bracket token (shouldn't happen with proper tokenization)
-            elif re.match(r'^\[[A-Za-z0-9_]+\]$', token):
-                # This is a field code without quoted term - invalid
-                return False
-            
-            else:
-                # Invalid token
-                return False
+    return True, None
+
+
+def _sequence_error(prev_token_type: int, prev_token: Optional[str],
+                    kind: int, token: str) -> str:
+    """
+    Error message for a token that may not follow the previous one.
     
-    # Last token must be operand or closing paren
-    if prev_token_type not in ('operand', 'close_paren'):
-        return False
+    PARAMETERS:
+    prev_token_type (int): Type of the previous token (_START if none)
+    prev_token (Optional[str]): The previous token (None if none)
+    kind (int): Type of the rejected token
+    token (str): The rejected token
     
-    return True
+    RETURNS:
+    str: Error message for parse_query()
+    """
+    if kind == _INVALID:
+        return f"Invalid term: {token}"
+    
+    if kind == _OPERATOR:
+        if prev_token_type == _START:
+            return f"Query cannot start with operator: {token}"
+        if prev_token_type == _OPERATOR:
+            return f"Double operator: {prev_token} {token}"
+        return f"Operator after opening parenthesis: {token}"
+    
+    if kind == _CLOSE_PAREN:
+        if prev_token_type == _START:
+            return "Closing parenthesis without opening parenthesis"
+        if prev_token_type == _OPERATOR:
+            return f"Operator before closing parenthesis: {prev_token}"
+        return "Empty parentheses: ()"
+    
+    # Operand or opening paren directly after an operand or closing paren
+    return f"Missing operator between {prev_token} and {token}"
 
 
+@lru_cache(maxsize=1024)
 def validate_multiline(query: str) -> bool:
     """
     Validate a multi-line boolean query.
@@ -369,9 +462,25 @@ def validate_multiline(query: str) -> bool:
     RETURNS:
     bool: True if valid, False otherwise
     """
-    lines = query.strip().split('\n')
-    combined_query = ' '.join(line.strip() for line in lines if line.strip())
-    return validate_single_line(combined_query)
+    return validate_single_line(_combine_lines(query))
+
+
+def _combine_lines(query: str) -> str:
+    """
+    Join the non-empty lines of a multi-line query into one line.
+    
+    Every run of whitespace (including the line breaks) becomes a single
+    space in one C-level split + join, instead of splitting into lines and
+    stripping each one. Runs of spaces inside a line are collapsed too,
+    which never changes whether the query is valid.
+    
+    PARAMETERS:
+    query (str): The multi-line query
+    
+    RETURNS:
+    str: The query on one line, words separated by single spaces
+    """
+    return ' '.join(query.split())
 
 
 # ============================================================================
@@ -428,61 +537,69 @@ def parse_query(query: str) -> Dict:
       - query (str): The original query
       - tokens (List[str]): Tokenized query
       - error (Optional[str]): Error message if parsing failed
+    
+    NOTE:
+    Results are cached per query text (see _parse_query_cached below);
+    clear_caches() empties the cache.
+    """
+    success, query_format, tokens, error = _parse_query_cached(query)
+    return {
+        'success': success,
+        'format': query_format,
+        'query': query,
+        'tokens': list(tokens),
+        'error': error
+    }
+
+
+@lru_cache(maxsize=1024)
+def _parse_query_cached(query: str) -> Tuple[bool, str, Tuple[str, ...], Optional[str]]:
+    """
+    Does the actual work for parse_query(); results are cached by query text.
+    
+    WHAT THIS DOES:
+    Validates and tokenizes the query and returns the result as an
+    immutable tuple (success, format, tokens, error), so it can be cached.
+    parse_query() builds a fresh dict from it on every call.
+    
+    WHY IT MATTERS:
+    The same query is often checked several times in a row (CLI reruns,
+    validation before and inside a search); repeats skip all parsing work.
     """
     query_stripped = query.strip()
     
     if not query_stripped:
-        return {
-            'success': False,
-            'format': 'UNKNOWN',
-            'query': query,
-            'tokens': [],
-            'error': 'Query is empty'
-        }
-    
-    # Detect format (single-line vs multi-line)
+        return (False, 'UNKNOWN', (), 'Query is empty')
+    
+    # Detect format (single-line vs multi-line) and tokenize once
     if '\n' in query_stripped:
         query_format = 'MULTI_LINE'
-        is_valid = validate_multiline(query_stripped)
+        # Validated as one line (see validate_multiline), but the reported
+        # tokens come from the query as written
+        scanned = list(_scan_tokens(_combine_lines(query_stripped)))
+        tokens = _tokenize_cached(query_stripped)
     else:
         query_format = 'SINGLE_LINE'
-        is_valid = validate_single_line(query_stripped)
-    
-    tokens = tokenize(query_stripped)
+        scanned = list(_scan_tokens(query_stripped))
+        tokens = tuple([token for kind, token in scanned])
     
-    if not is_valid:
-        error_msg = "Query structure is invalid"
-        
-        # Try to provide more specific error message
-        if query_format == 'SINGLE_LINE':
-            # Check for common errors
-            if tokens and tokens[0].upper() in {'AND', 'OR', 'NOT'}:
-                error_msg = f"Query cannot start with operator: {tokens[0]}"
-            elif tokens and tokens[-1].upper() in {'AND', 'OR', 'NOT'}:
-                error_msg = f"Query cannot end with operator: {tokens[-1]}"
-            else:
-                # Check for double operators
-                for i in range(len(tokens) - 1):
-                    if tokens[i].upper() in {'AND', 'OR', 'NOT'} and \
-                       tokens[i + 1].upper() in {'AND', 'OR', 'NOT'}:
-                        error_msg = f"Double operator: {tokens[i]} {tokens[i + 1]}"
-                        break
-        
-        return {
-            'success': False,
-            'format': query_format,
-            'query': query,
-            'tokens': tokens,
-            'error': error_msg
-        }
+    is_valid, error_msg = _validate_tokens(scanned)
+    return (is_valid, query_format, tokens, error_msg)
+
+
+def clear_caches() -> None:
+    """
+    Empty all result caches of this module.
     
-    return {
-        'success': True,
-        'format': query_format,
-        'query': query,
-        'tokens': tokens,
-        'error': None
-    }
+    WHAT THIS DOES:
+    tokenize(), validate_single_line(), validate_multiline() and
+    parse_query() cache their results per query text. This drops every
+    cached result, e.g. between benchmark runs or tests.
+    """
+    _tokenize_cached.cache_clear()
+    validate_single_line.cache_clear()
+    validate_multiline.cache_clear()
+    _parse_query_cached.cache_clear()
 
 
 # ============================================================================
@@ -504,9 +621,21 @@ def get_query_info(query: str) -> Dict:
     Dict with query information (tokens, structure, etc.)
     """
     tokens = tokenize(query.strip())
-    field_terms = [t for t in tokens if is_field_term(t)]
-    operators = [t for t in tokens if t.upper() in {'AND', 'OR', 'NOT', 'UND', 'ODER', 'NICHT'}]
-    operands = [t for t in tokens if t not in {'(', ')', *operators}]
+    
+    # Classify every token once
+    field_terms = []
+    operators = []
+    operands = []
+    has_parentheses = False
+    for t in tokens:
+        if t in _INFO_OPERATORS_ANYCASE:
+            operators.append(t)
+        elif t == '(' or t == ')':
+            has_parentheses = True
+        else:
+            operands.append(t)
+            if is_field_term(t):
+                field_terms.append(t)
     
     return {
         'query': query,
@@ -518,7 +647,7 @@ def get_query_info(query: str) -> Dict:
         'num_operators': len(operators),
         'operands': operands,
         'num_operands': len(operands),
-        'has_parentheses': '(' in tokens or ')' in tokens,
+        'has_parentheses': has_parentheses,
         'is_multiline': '\n' in query
     }
 
@@ -15,7 +15,7 @@ Sie kümmert sich um:
 2. Logging über den zentralen LoggingManager
 3. Query-Dateien mit Python-style Kommentaren laden
 4. Query validieren
-5. Passenden Adapter aufrufen (PubMed, Europe PMC, Cochrane)
+5. Passenden Adapter aufrufen (PubMed, Europe PMC, Cochrane - auch mehrere parallel)
 6. Ergebnisse exportieren/anzeigen
 
 NEUES FEATURE (09.12.2025)
@@ -36,6 +36,7 @@ VERWENDUNG
 python main.py --query-file queries/sehr_komplex.txt --source europepmc --limit 20
 python main.py --query "cancer AND (2020:2025)" --source pubmed --limit 10 --output results.csv
 python main.py --query-file queries/coenzym_q10.txt --source pubmed --verbose
+python main.py --query "cancer AND (2020:2025)" --source pubmed,europepmc,cochrane --output results.csv
 
 QUERY-FORMAT (UNIVERSELL)
 =========================
@@ -45,9 +46,35 @@ QUERY-FORMAT (UNIVERSELL)
 Der Query-Compiler übersetzt das automatisch für die gewählte Datenbank!
 """
 
+import io
+import re
+import csv
 import sys
+import gzip
+import json
+import logging
+import functools
+import importlib
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterable, IO, Iterator, List, Optional, Union
+
+# Optional: orjson serialisiert JSON 5-10x schneller als das json-Modul und
+# liefert für Artikel-Dictionaries exakt dieselbe Ausgabe. Ohne orjson wird
+# einfach json genutzt.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: zstandard für komprimierte Exporte (.zst). gzip (.gz) geht immer.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SCHRITT 1: PROJECT ROOT zu Python-Pfad hinzufügen
@@ -62,24 +89,21 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.core.logging_manager import LoggingManager
 
-# Werden in main() initialisiert
+# Wird in main() initialisiert (Handler/Format hängen an der Datenbank)
 log_manager = None
-logger = None
+
+# Der Logger selbst steht schon beim Import fest: die Handler setzt der
+# LoggingManager am Root-Logger, dieser Logger reicht nur weiter. So
+# funktionieren auch validate_query_syntax() & Co. ohne main().
+logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════════════
-# SCHRITT 3: Datenbank-Adapter importieren
+# SCHRITT 3: Datenbank-Adapter (werden erst bei Bedarf importiert)
 # ═══════════════════════════════════════════════════════════════════════════
 
-try:
-    from src.databases.pubmed import PubMedAdapter
-    from src.databases.europe_pmc import EuropePMCAdapter
-    from src.databases.cochrane import CochraneAdapter
-except ModuleNotFoundError as e:
-    print(f"❌ Import Error: {e}")
-    print("Stelle sicher, dass du von PROJECT ROOT ausführst, z.B.:")
-    print(f"  cd {PROJECT_ROOT}")
-    print("  python main.py --query-file queries/test.txt --source pubmed")
-    sys.exit(1)
+# Pro Aufruf wird nur EIN Adapter gebraucht. Die Adapter-Module (inkl.
+# requests usw.) werden deshalb erst in _get_adapter() importiert, wenn
+# die Suche startet - das spart Startzeit, z.B. bei --help.
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SCHRITT 4: QueryCompiler für Queries importieren
@@ -98,7 +122,7 @@ from src.core.query_parser_with_comments import load_query_with_comments
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def load_query(filepath: str) -> str:
+def load_query(filepath: Union[str, Path]) -> str:
     """
     Lädt eine Query aus einer Textdatei mit Comment-Support.
 
@@ -128,7 +152,7 @@ def load_query(filepath: str) -> str:
     4. Gibt die bereinigte Query zurück
 
     Args:
-        filepath (str): Pfad zur Query-Datei
+        filepath (str | Path): Pfad zur Query-Datei
 
     Returns:
         str: Die geladene und bereinigte Query
@@ -136,21 +160,60 @@ def load_query(filepath: str) -> str:
     try:
         query, original = load_query_with_comments(filepath)
 
+        # is_file() = ein einziger stat()-Aufruf
         file_path = Path(filepath)
-        if not file_path.exists():
-            file_path = PROJECT_ROOT / filepath
+        if not file_path.is_file():
+            file_path = PROJECT_ROOT / file_path
 
-        logger.info(f"📂 Query aus Datei geladen: {file_path}")
-        logger.debug(f"Original-Inhalt mit Kommentaren:\n{original}")
-        logger.debug(f"Bereinigte Query (Kommentare entfernt): {query}")
+        logger.info("📂 Query aus Datei geladen: %s", file_path)
+        logger.debug("Original-Inhalt mit Kommentaren:\n%s", original)
+        logger.debug("Bereinigte Query (Kommentare entfernt): %s", query)
 
         return query
 
     except (FileNotFoundError, IOError) as e:
-        logger.error(f"❌ {e}")
+        logger.error("❌ %s", e)
         sys.exit(1)
 
 
+# Natürlichsprachige Satzstrukturen, die validate_query_syntax() ablehnt.
+# Alle Muster stecken in EINEM vorkompilierten Ausdruck, damit die Query
+# nur einmal durchsucht wird statt einmal pro Muster.
+# (Neue Prüfungen bitte ebenso als Modul-Konstante mit re.compile()
+# anlegen - nie re.search(pattern, ...) im Funktionsrumpf.)
+_NATURAL_LANGUAGE_RE = re.compile(
+    r"\bwelche\b.*\brolle\b"         # "welche rolle"
+    r"|\bwirksamkeit\s+von\b"        # "wirksamkeit von"
+    r"|\beffektivität\s+von\b"       # "effektivität von"
+    r"|\bsuche\s+nach\b"             # "suche nach"
+    r"|\buntersuchung\s+der\b"       # "untersuchung der"
+    r"|\bfunktion\s+von\b"           # "funktion von"
+)
+
+
+# Alles außer runden Klammern - gilt für jedes Zeichen (auch Umlaute,
+# griechische oder chinesische Schrift). Übrig bleibt die Klammerfolge.
+_NOT_PARENS_RE = re.compile(r"[^()]+")
+
+
+def _parens_in_order(query: str) -> bool:
+    """
+    Prüft, ob keine ")" vor der zugehörigen "(" steht, z.B. ")a(".
+
+    _NOT_PARENS_RE filtert die Klammern in einem C-Durchgang heraus,
+    die Python-Schleife läuft danach nur noch über die Klammern selbst.
+    """
+    depth = 0
+    for char in _NOT_PARENS_RE.sub("", query):
+        if char == "(":
+            depth += 1
+        else:
+            depth -= 1
+            if depth < 0:
+                return False
+    return True
+
+
 def validate_query_syntax(query: str) -> bool:
     """
     Validiert die Query-Syntax.
@@ -178,10 +241,13 @@ def validate_query_syntax(query: str) -> bool:
     ✗ "Wirksamkeit von Akupunktur bei Rückenschmerzen"
     ✗ "Ist squirting erfolgreicher als Geschlechtsverkehr?"
     """
-    import re
-
-    # PRÜFUNG 1: Sind Klammern balanciert?
-    if query.count("(") != query.count(")"):
+    # PRÜFUNG 1: Sind Klammern balanciert - und in der richtigen Reihenfolge?
+    # (zwei str.count()-Aufrufe laufen in C und sind schneller als eine
+    # Python-Schleife, die beide Klammern in einem Durchgang zählt; die
+    # Reihenfolge wird nur bei gleicher Anzahl - und nur wenn es überhaupt
+    # Klammern gibt - geprüft)
+    open_count = query.count("(")
+    if open_count != query.count(")") or (open_count and not _parens_in_order(query)):
         logger.error("❌ Klammern nicht balanciert")
         logger.error(" Beispiel OK: (cancer OR tumor) AND (2020:2025)")
         logger.error(" Beispiel FALSCH: (cancer OR tumor AND (2020:2025)")
@@ -194,22 +260,11 @@ def validate_query_syntax(query: str) -> bool:
         return False
 
     # PRÜFUNG 3: Prüfe auf natürlichsprachige Satzstrukturen
-    suspicious_patterns = [
-        r"\bwelche\b.*\brolle\b",      # "welche rolle"
-        r"\bwirksamkeit\s+von\b",      # "wirksamkeit von"
-        r"\beffektivität\s+von\b",     # "effektivität von"
-        r"\bsuche\s+nach\b",           # "suche nach"
-        r"\buntersuchung\s+der\b",     # "untersuchung der"
-        r"\bfunktion\s+von\b",         # "funktion von"
-    ]
-
-    query_lower = query.lower()
-
-    for pattern in suspicious_patterns:
-        if re.search(pattern, query_lower):
-            logger.error("❌ Natürlichsprachige Satzstruktur erkannt")
-            logger.error(" Nutze stattdessen: (Begriff1 AND Begriff2) oder (Begriff1 OR Begriff2)")
-            return False
+    # (alle Muster in einem Durchgang, siehe _NATURAL_LANGUAGE_RE)
+    if _NATURAL_LANGUAGE_RE.search(query.lower()):
+        logger.error("❌ Natürlichsprachige Satzstruktur erkannt")
+        logger.error(" Nutze stattdessen: (Begriff1 AND Begriff2) oder (Begriff1 OR Begriff2)")
+        return False
 
     # Alles ok!
     logger.info("✓ Query-Format ist korrekt")
@@ -220,129 +275,479 @@ def validate_query_syntax(query: str) -> bool:
     return True
 
 
-def search(query: str, source: str, limit: int) -> list:
+# Adapter pro Datenbank: (Modul, Klassenname). Importiert wird erst in
+# _get_adapter() - und nur das eine Modul, das gebraucht wird.
+_ADAPTERS = {
+    "pubmed": ("src.databases.pubmed", "PubMedAdapter"),
+    "europepmc": ("src.databases.europe_pmc", "EuropePMCAdapter"),
+    "cochrane": ("src.databases.cochrane", "CochraneAdapter"),
+}
+
+
+def _parse_sources(value: str) -> str:
+    """
+    argparse-Typ für --source: eine oder mehrere Datenbanken, kommagetrennt.
+
+    Gibt die bereinigte Liste zurück (Lowercase, ohne Leerzeichen und
+    Doppelte), z.B. "PubMed, europepmc" -> "pubmed,europepmc".
+
+    Raises:
+        argparse.ArgumentTypeError: Bei leerer Angabe oder unbekannter Datenbank
+    """
+    sources = [name.strip().lower() for name in value.split(",") if name.strip()]
+    unknown = [name for name in sources if name not in _ADAPTERS]
+    if not sources or unknown:
+        raise argparse.ArgumentTypeError(
+            f"Unbekannte Quelle: {', '.join(unknown) or value!r} "
+            f"(erlaubt: {', '.join(_ADAPTERS)})"
+        )
+    return ",".join(dict.fromkeys(sources))
+
+
+def _get_adapter(source: str):
+    """
+    Importiert die Adapter-Klasse für die gewählte Datenbank.
+
+    Der Import passiert erst hier (und nur für die eine gewählte
+    Datenbank) statt beim Programmstart.
+
+    Args:
+        source (str): 'pubmed', 'europepmc' oder 'cochrane' (Lowercase)
+
+    Returns:
+        type: Die Adapter-Klasse
+    """
+    module_name, class_name = _ADAPTERS[source]
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        logger.error("❌ Import Error: %s", e)
+        logger.error("Stelle sicher, dass du von PROJECT ROOT ausführst, z.B.:")
+        logger.error("  cd %s", PROJECT_ROOT)
+        logger.error("  python main.py --query-file queries/test.txt --source pubmed")
+        sys.exit(1)
+
+    return getattr(module, class_name)
+
+
+def _dedup_key(article: dict) -> Optional[tuple]:
+    """
+    Liefert den Schlüssel, über den search() doppelte Artikel erkennt.
+
+    Reihenfolge:
+    • DOI (Kleinschreibung) - gilt über alle Datenbanken hinweg
+    • sonst die ID zusammen mit der Quelle ('source'): gleiche IDs aus
+      verschiedenen Datenbanken sind nicht derselbe Artikel
+    • nur wenn der Artikel gar keine ID hat: Titel + Jahr + Journal
+      (der Titel allein reicht nicht - "Erratum", "Editorial" oder
+      "Correction" heißen viele verschiedene Artikel)
+
+    Platzhalter wie 'N/A' zählen nicht als Wert. Ohne DOI, ID und Titel
+    gibt es keinen Schlüssel (None) - der Artikel wird nie gefiltert.
+    """
+    doi = article.get("doi")
+    if doi and doi != "N/A":
+        return ("doi", doi.lower())
+    article_id = article.get("id")
+    if article_id and article_id != "N/A":
+        return ("id", article.get("source"), article_id)
+    title = article.get("title")
+    if title:
+        return ("title", str(title).casefold(), article.get("year"), article.get("journal"))
+    return None
+
+
+def _search_single(source: str, compiler: QueryCompiler, limit: int) -> Iterator[dict]:
     """
-    Führt die Suche in der gewählten Datenbank durch.
+    Sucht in EINER Datenbank und gibt die Artikel seitenweise weiter.
+
+    Args:
+        source (str): 'pubmed', 'europepmc' oder 'cochrane' (Lowercase)
+        compiler (QueryCompiler): Compiler mit der universellen Query
+        limit (int): Maximale Anzahl Artikel
+
+    Yields:
+        dict: Artikel, sobald der Adapter sie liefert
+    """
+    # Wähle passenden Adapter (wird erst jetzt importiert)
+    adapter = _get_adapter(source)()
+    logger.info("✓ %s-Adapter initialisiert", source.upper())
+
+    # Kompiliere die Query für die gewählte Datenbank
+    compiled_query = compiler.compile_for_source(source)
+
+    yield from adapter.search_iter(compiled_query, limit=limit)
+
+
+def _search_parallel(sources: List[str], compiler: QueryCompiler, limit: int) -> Iterator[dict]:
+    """
+    Sucht in mehreren Datenbanken gleichzeitig (ein Thread pro Datenbank).
+
+    Die Adapter warten fast nur auf das Netzwerk - dabei geben Threads
+    den GIL frei. Die Gesamtdauer ist so die der langsamsten Datenbank
+    statt der Summe aller. Die Ergebnisse einer Datenbank werden
+    weitergegeben, sobald sie komplett ist (as_completed).
+
+    Fehler einer Datenbank werden geloggt; die übrigen laufen weiter.
+
+    Args:
+        sources (List[str]): Datenbanken (Lowercase)
+        compiler (QueryCompiler): Compiler mit der universellen Query
+        limit (int): Maximale Anzahl Artikel PRO Datenbank
+
+    Yields:
+        dict: Artikel, Datenbank für Datenbank
+    """
+    # Import, Adapter-Setup und Query-Compiler laufen vorab im Hauptthread,
+    # in den Threads nur noch die Netzwerk-Anfragen
+    jobs = {}
+    for source in sources:
+        adapter = _get_adapter(source)()
+        logger.info("✓ %s-Adapter initialisiert", source.upper())
+        jobs[source] = (adapter, compiler.compile_for_source(source))
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            executor.submit(adapter.search, compiled_query, limit=limit): source
+            for source, (adapter, compiled_query) in jobs.items()
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error("❌ Fehler bei Suche in %s: %s", source.upper(), e)
+                continue
+            logger.info("✓ %s: %d Artikel geladen", source.upper(), len(results))
+            yield from results
+
+
+def search(query: str, source: str, limit: int) -> Iterator[dict]:
+    """
+    Führt die Suche in der/den gewählten Datenbank(en) durch.
+
+    Die Funktion ist ein Generator: Artikel werden weitergegeben, sobald
+    der Adapter sie liefert. Export und Anzeige verarbeiten sie sofort,
+    statt auf die komplette Liste zu warten (Speicher bleibt konstant).
+
+    Mehrere Datenbanken (kommagetrennt, z.B. "pubmed,europepmc") werden
+    parallel durchsucht, siehe _search_parallel().
 
     Workflow:
     =========
     1. Wähle passenden Adapter basierend auf 'source'
     2. Kompiliere die universelle Query für die Datenbank
-    3. Rufe adapter.search() auf
-    4. Gebe die Ergebnisse zurück
+    3. Rufe adapter.search_iter() auf (bzw. alle Adapter parallel)
+    4. Überspringe Duplikate (gleiche DOI, sonst gleiche Quelle + ID,
+       siehe _dedup_key) - über DOI auch zwischen verschiedenen Datenbanken
+    5. Gebe die Artikel einzeln weiter (yield)
 
     Args:
         query (str): Die universelle Query
-        source (str): 'pubmed', 'europepmc' oder 'cochrane'
-        limit (int): Maximale Anzahl Artikel
+        source (str): 'pubmed', 'europepmc', 'cochrane' oder mehrere
+            davon, kommagetrennt
+        limit (int): Maximale Anzahl Artikel (pro Datenbank)
 
-    Returns:
-        list[dict]: Liste von Artikel-Dictionaries
+    Yields:
+        dict: Ein Artikel-Dictionary pro gefundenem Artikel
+
+    Raises:
+        ValueError: Bei unbekannter Datenbank (beim ersten Durchlauf)
     """
+    sources = [name.strip().lower() for name in source.split(",")]
+
     logger.info("\n" + "=" * 80)
     logger.info("STARTE SUCHE")
     logger.info("=" * 80)
-    logger.info(f"Query: {query}")
-    logger.info(f"Quelle: {source.upper()}")
-    logger.info(f"Limit: {limit} Artikel")
-
-    # Wähle passenden Adapter
-    if source.lower() == "pubmed":
-        adapter = PubMedAdapter()
-    elif source.lower() == "europepmc":
-        adapter = EuropePMCAdapter()
-    elif source.lower() == "cochrane":
-        adapter = CochraneAdapter()
-    else:
-        logger.error(f"❌ Unbekannte Quelle: {source}")
-        logger.error(" Akzeptiert: pubmed, europepmc, cochrane")
-        sys.exit(1)
-
-    logger.info(f"✓ {source.upper()}-Adapter initialisiert")
+    logger.info("Query: %s", query)
+    logger.info("Quelle: %s", ", ".join(sources).upper())
+    logger.info("Limit: %d Artikel", limit)
+
+    # Die Quellen prüft schon argparse (_parse_sources); das hier fängt
+    # Aufrufe aus eigenem Code ab (kein assert: das entfällt bei python -O)
+    unknown = [name for name in sources if name not in _ADAPTERS]
+    if unknown:
+        raise ValueError(
+            f"Unbekannte Quelle: {', '.join(unknown)} (erlaubt: {', '.join(_ADAPTERS)})"
+        )
 
-    # Kompiliere die Query für die gewählte Datenbank
     compiler = QueryCompiler(query)
-    compiled_query = compiler.compile_for_source(source)
-
-    # Führe Suche durch
+    if len(sources) == 1:
+        articles = _search_single(sources[0], compiler, limit)
+    else:
+        articles = _search_parallel(sources, compiler, limit)
+
+    # Führe Suche durch (Artikel werden beim Durchlaufen gezählt).
+    # Datenbanken liefern denselben Artikel manchmal mehrfach (z.B. über
+    # Seitengrenzen oder Datenbanken hinweg) - ein Set der Schlüssel
+    # filtert das in O(1).
+    count = 0
+    duplicates = 0
+    seen = set()
     try:
-        results = adapter.search(compiled_query, limit=limit)
-        logger.info(f"✓ Suche abgeschlossen: {len(results)} Artikel gefunden")
-        return results
+        for article in articles:
+            key = _dedup_key(article)
+            if key is not None:
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+            count += 1
+            yield article
     except Exception as e:
-        logger.error(f"❌ Fehler bei Suche: {e}")
+        logger.error("❌ Fehler bei Suche: %s", e)
         import traceback
         logger.debug(traceback.format_exc())
-        return []
+        return
+
+    logger.info("✓ Suche abgeschlossen: %d Artikel gefunden", count)
+    if duplicates:
+        logger.info(" %d doppelte Artikel übersprungen", duplicates)
+
+
+# Spalten des CSV-Exports - in der Reihenfolge, in der alle Adapter
+# (PubMed, Europe PMC, Cochrane) ihre Artikel-Dictionaries aufbauen
+_FIELDNAMES = (
+    "id", "source", "title", "year", "authors",
+    "journal", "doi", "url", "abstract",
+)
+
+# Eine CSV-Zeile = ein itemgetter-Aufruf (C) über alle Spalten; fehlende
+# Felder füllt vorher _EMPTY_ROW mit "" auf
+_csv_row = itemgetter(*_FIELDNAMES)
+_EMPTY_ROW = dict.fromkeys(_FIELDNAMES, "")
+
+# Ab so vielen Artikeln wird JSON kompakt (ohne Einrückung) geschrieben:
+# halb so viele Bytes und mehr als doppelt so schnell. Kleinere Exporte
+# bleiben zum Lesen eingerückt.
+_COMPACT_JSON_MIN_RESULTS = 1000
+
 
+def _open_output(output_path: Path, newline: Optional[str] = None, binary: bool = False) -> IO:
+    """
+    Öffnet die Exportdatei zum Schreiben (Text, UTF-8 - oder Bytes).
+
+    Endet der Pfad auf .gz oder .zst, wird komprimiert geschrieben (je
+    Level 3: kaum langsamer als unkomprimiert, Dateien 5-10x kleiner).
+    Die Exporter schreiben in beiden Fällen einfach Text (bzw. mit
+    binary=True fertige UTF-8-Bytes) hinein.
+    """
+    compression = output_path.suffix.lower()
+    if compression == ".gz":
+        if binary:
+            return gzip.open(output_path, "wb", compresslevel=3)
+        return gzip.open(output_path, "wt", encoding="utf-8", newline=newline, compresslevel=3)
+    if compression == ".zst":
+        compressor = zstandard.ZstdCompressor(level=3)
+        stream = compressor.stream_writer(open(output_path, "wb"))
+        if binary:
+            return stream
+        return io.TextIOWrapper(stream, encoding="utf-8", newline=newline)
+    # Großer Schreibpuffer (1 MB) = weniger Schreibzugriffe auf die Datei
+    if binary:
+        return open(output_path, "wb", buffering=1 << 20)
+    return open(output_path, "w", newline=newline, encoding="utf-8", buffering=1 << 20)
+
+
+def _export_csv(results: Iterable[dict], output_path: Path) -> None:
+    """
+    Schreibt die Artikel als CSV (für Excel/Spreadsheets).
+
+    csv.writer mit festen Spalten statt DictWriter: pro Zeile ein
+    itemgetter-Aufruf statt Dict-Lookups und Feldprüfung im DictWriter.
+    writerows() bekommt einen Generator: jede Zeile wird geschrieben,
+    sobald der Artikel ankommt.
+    """
+    with _open_output(output_path, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(_FIELDNAMES)
+        writer.writerows(_csv_row({**_EMPTY_ROW, **result}) for result in results)
+
+    logger.info("✓ Ergebnisse als CSV exportiert: %s", output_path)
+
+
+# Beide Varianten liefern UTF-8-Bytes: orjson erzeugt sie direkt, die
+# JSON-Exporter schreiben sie ohne Umweg über str in eine Binärdatei.
+if orjson is not None:
+    def _json_compact(article: dict) -> bytes:
+        return orjson.dumps(article)
+
+    def _json_indented(article: dict) -> bytes:
+        return orjson.dumps(article, option=orjson.OPT_INDENT_2)
+else:
+    def _json_compact(article: dict) -> bytes:
+        return json.dumps(article, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def _json_indented(article: dict) -> bytes:
+        return json.dumps(article, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _export_json(results: Iterable[dict], output_path: Path) -> None:
+    """
+    Schreibt die Artikel als JSON (für weitere Verarbeitung).
+
+    Jeder Artikel wird einzeln serialisiert (orjson bzw. json.dumps() mit
+    C-Encoder) und sofort geschrieben, statt die ganze Liste als einen String
+    aufzubauen. Über das Format (eingerückt/kompakt) entscheiden die
+    ersten _COMPACT_JSON_MIN_RESULTS Artikel - nur so viele werden
+    zwischengespeichert.
+    """
+    head = list(islice(results, _COMPACT_JSON_MIN_RESULTS))
+
+    with _open_output(output_path, binary=True) as f:
+        if len(head) < _COMPACT_JSON_MIN_RESULTS:
+            # Gleiche Ausgabe wie json.dump(results, f, indent=2):
+            # Zeilenumbrüche kommen im JSON-Text nur als Formatierung
+            # vor (in Strings stehen sie als \n)
+            f.write(b"[\n  ")
+            f.write(b",\n  ".join(
+                _json_indented(result).replace(b"\n", b"\n  ") for result in head
+            ))
+            f.write(b"\n]")
+        else:
+            separator = b"["
+            for result in chain(head, results):
+                f.write(separator)
+                f.write(_json_compact(result))
+                separator = b","
+            f.write(b"]")
+
+    logger.info("✓ Ergebnisse als JSON exportiert: %s", output_path)
+
+
+def _export_jsonl(results: Iterable[dict], output_path: Path) -> None:
+    """
+    Schreibt die Artikel als JSON Lines (ein kompaktes JSON-Objekt pro Zeile).
+
+    Für große Ergebnismengen: jeder Artikel wird sofort geschrieben, es
+    wird nichts zwischengespeichert, und die Datei lässt sich später
+    Zeile für Zeile einlesen.
+    """
+    with _open_output(output_path, binary=True) as f:
+        for result in results:
+            f.write(_json_compact(result))
+            f.write(b"\n")
+
+    logger.info("✓ Ergebnisse als JSON Lines exportiert: %s", output_path)
 
-def export_results(results: list, filepath: str) -> None:
+
+# Export-Funktion pro Dateiendung (Kleinschreibung). Neue Formate
+# brauchen nur eine _export_*-Funktion und einen Eintrag hier.
+_EXPORTERS = {
+    ".csv": _export_csv,
+    ".json": _export_json,
+    ".jsonl": _export_jsonl,
+}
+
+# Endungen, die _open_output() komprimiert schreibt (z.B. results.csv.gz)
+_COMPRESSED_SUFFIXES = (".gz", ".zst")
+
+
+def export_results(results: Iterable[dict], filepath: Union[str, Path]) -> None:
     """
     Exportiert die Suchergebnisse in eine Datei.
 
-    Unterstützte Formate:
-    =====================
+    Die Artikel werden beim Durchlaufen geschrieben - 'results' darf
+    also auch der Generator aus search() sein.
+
+    Unterstützte Formate (siehe _EXPORTERS):
+    ========================================
     • CSV (.csv)  - für Excel/Spreadsheets
     • JSON (.json) - für weitere Verarbeitung
+    • JSON Lines (.jsonl) - ein Artikel pro Zeile, für große Exporte
+
+    Jedes Format kann zusätzlich komprimiert werden: .gz (gzip) oder
+    .zst (zstandard, falls installiert), z.B. "results.csv.gz".
 
     Args:
-        results (list): Liste von Artikel-Dictionaries
-        filepath (str): Zieldatei-Pfad (muss .csv oder .json sein)
+        results (Iterable[dict]): Artikel-Dictionaries (Liste oder Generator)
+        filepath (str | Path): Zieldatei-Pfad (.csv, .json oder .jsonl)
 
     Beispiel:
         export_results(results, "output/results.csv")
         export_results(results, "output/results.json")
+        export_results(results, "output/results.jsonl.gz")
     """
-    import csv
-    import json
+    output_path = Path(filepath)
 
-    if not results:
+    # Komprimierung (.gz/.zst) abtrennen, dann das Format über die
+    # Dateiendung wählen (ein Dict-Lookup)
+    format_path = output_path
+    if output_path.suffix.lower() in _COMPRESSED_SUFFIXES:
+        format_path = output_path.with_suffix("")
+        if output_path.suffix.lower() == ".zst" and zstandard is None:
+            logger.error("❌ Für .zst-Exporte bitte zstandard installieren: pip install zstandard")
+            return
+
+    exporter = _EXPORTERS.get(format_path.suffix.lower())
+    if exporter is None:
+        logger.warning("⚠️ Unbekanntes Format: %s", filepath)
+        logger.warning(" Akzeptiert: .csv, .json oder .jsonl (optional mit .gz/.zst)")
+        return
+
+    # Ersten Artikel holen: ohne Ergebnisse wird keine Datei angelegt
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
         logger.warning("⚠️ Keine Ergebnisse zum Exportieren")
         return
 
-    output_path = Path(filepath)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    exporter(chain((first,), results), output_path)
 
-    if filepath.endswith(".csv"):
-        # CSV Export
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            fieldnames = results[0].keys()
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
 
-        logger.info(f"✓ Ergebnisse als CSV exportiert: {filepath}")
+# Felder der Terminal-Vorschau mit Platzhalter für fehlende Werte
+_PREVIEW_DEFAULTS = dict.fromkeys(("title", "authors", "year", "doi"), "N/A")
 
-    elif filepath.endswith(".json"):
-        # JSON Export
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
 
-        logger.info(f"✓ Ergebnisse als JSON exportiert: {filepath}")
-    else:
-        logger.warning(f"⚠️ Unbekanntes Format: {filepath}")
-        logger.warning(" Akzeptiert: .csv oder .json")
+def print_results(results: Iterable[dict], max_show: int = 5) -> None:
+    """
+    Zeigt die ersten Suchergebnisse im Terminal an.
 
+    Nur die ersten 'max_show' Artikel werden behalten (itertools.islice),
+    der Rest wird beim Durchlaufen nur gezählt - das funktioniert mit
+    Listen und mit dem Generator aus search() gleichermaßen.
 
-def main() -> None:
+    Args:
+        results (Iterable[dict]): Artikel-Dictionaries (Liste oder Generator)
+        max_show (int): Wie viele Artikel ausführlich angezeigt werden
     """
-    Hauptprogramm - orchestriert den gesamten Ablauf.
+    results = iter(results)
+    shown = list(islice(results, max_show))
+    if not shown:
+        return
+    remaining = sum(1 for _ in results)
 
-    Workflow:
-    =========
-    1. Parse Kommandozeilen-Argumente
-    2. Initialisiere LoggingManager
-    3. Lade Query (aus Datei oder direkter Eingabe)
-    4. Validiere Query-Syntax
-    5. Führe Suche durch
-    6. Exportiere Ergebnisse (oder zeige sie an)
+    logger.info("\n" + "=" * 80)
+    logger.info("ERGEBNISSE (%d Artikel)", len(shown) + remaining)
+    logger.info("=" * 80 + "\n")
+
+    for i, result in enumerate(shown, 1):
+        # Fehlende Felder in einem Schritt mit "N/A" auffüllen
+        row = {**_PREVIEW_DEFAULTS, **result}
+        logger.info("%d. %s", i, row["title"])
+        logger.info(" Authors: %s", row["authors"])
+        logger.info(" Year: %s", row["year"])
+        logger.info(" DOI: %s", row["doi"])
+        logger.info("")  # Leerzeile für bessere Lesbarkeit
+
+    if remaining:
+        logger.info("... und %d weitere Artikel (mit --output exportieren)", remaining)
+        logger.info("")
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    global log_manager, logger
+    Baut den Kommandozeilen-Parser (einmal pro Prozess).
 
-    # ═══════════════════════════════════════════════════════════════════
-    # Kommandozeilen-Parser definieren
-    # ═══════════════════════════════════════════════════════════════════
+    Der Parser hängt nicht von sys.argv ab und wird daher zwischengespeichert:
+    Wer main() mehrfach im selben Prozess aufruft (Skripte, Tests),
+    baut Argumente, Hilfetexte und Formatter nicht jedes Mal neu.
 
+    Returns:
+        argparse.ArgumentParser: Parser für alle Optionen von main()
+    """
     parser = argparse.ArgumentParser(
         description="Scientific Research Tool - Formatierte Queries mit automatischem Query-Compiler",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -364,6 +769,7 @@ BEISPIELE:
 python main.py --query-file queries/sehr_komplex.txt --source europepmc --limit 20
 python main.py --query "cancer AND (2020:2025)" --source pubmed --limit 10 --output results.csv
 python main.py --query-file queries/coenzym_q10.txt --source pubmed --verbose
+python main.py --query "cancer AND (2020:2025)" --source pubmed,europepmc,cochrane --output results.csv
 """
     )
 
@@ -375,16 +781,16 @@ python main.py --query-file queries/coenzym_q10.txt --source pubmed --verbose
 
     parser.add_argument(
         "--query-file",
-        type=str,
+        type=Path,
         help="Universelle Query aus Textdatei laden (unterstützt Python-style Kommentare #)",
     )
 
     parser.add_argument(
         "--source",
-        type=str,
+        type=_parse_sources,
         default="pubmed",
-        choices=["pubmed", "europepmc", "cochrane"],
-        help="Datenbank (default: pubmed)",
+        help="Datenbank: pubmed, europepmc oder cochrane - mehrere kommagetrennt "
+             "werden parallel durchsucht, z.B. pubmed,europepmc (default: pubmed)",
     )
 
     parser.add_argument(
@@ -396,8 +802,8 @@ python main.py --query-file queries/coenzym_q10.txt --source pubmed --verbose
 
     parser.add_argument(
         "--output",
-        type=str,
-        help="Exportiere Ergebnisse in Datei (.csv oder .json)",
+        type=Path,
+        help="Exportiere Ergebnisse in Datei (.csv, .json oder .jsonl, optional mit .gz/.zst)",
     )
 
     parser.add_argument(
@@ -406,14 +812,42 @@ python main.py --query-file queries/coenzym_q10.txt --source pubmed --verbose
         help="Verbose Logging (DEBUG Level - sehr detailliert)",
     )
 
+    return parser
+
+
+def main() -> None:
+    """
+    Hauptprogramm - orchestriert den gesamten Ablauf.
+
+    Workflow:
+    =========
+    1. Parse Kommandozeilen-Argumente
+    2. Initialisiere LoggingManager
+    3. Lade Query (aus Datei oder direkter Eingabe)
+    4. Validiere Query-Syntax
+    5. Führe Suche durch
+    6. Exportiere Ergebnisse (oder zeige sie an)
+    """
+    global log_manager
+
+    # --help und ungültige Argumente beenden das Programm schon hier -
+    # noch bevor der LoggingManager Log-Verzeichnis und -Datei anlegt
+    parser = _build_parser()
     args = parser.parse_args()
 
+    # Ohne Query gibt es nichts zu tun: ebenfalls vor dem Logging-Setup
+    # abbrechen, damit keine leere Log-Datei entsteht
+    if not (args.query_file or args.query):
+        parser.print_help()
+        parser.exit(1, "\n❌ Bitte --query oder --query-file angeben\n")
+
     # ═══════════════════════════════════════════════════════════════════
     # LoggingManager mit gewählter Datenbank initialisieren
     # ═══════════════════════════════════════════════════════════════════
 
-    log_manager = LoggingManager(args.source.lower())
-    logger = log_manager.get_logger(__name__)
+    # Bei mehreren Datenbanken: eine gemeinsame Log-Datei, z.B.
+    # logs/pubmed+europepmc_search_<Datum>.log
+    log_manager = LoggingManager(args.source.replace(",", "+"))
 
     # ═══════════════════════════════════════════════════════════════════
     # Verbose-Mode aktivieren (falls gewünscht)
@@ -432,13 +866,9 @@ python main.py --query-file queries/coenzym_q10.txt --source pubmed --verbose
 
     if args.query_file:
         query = load_query(args.query_file)
-    elif args.query:
-        query = args.query
-        logger.info(f"📝 Query aus Kommandozeile: {query[:80]}...")
     else:
-        logger.error("❌ Bitte --query oder --query-file angeben")
-        parser.print_help()
-        sys.exit(1)
+        query = args.query
+        logger.info("📝 Query aus Kommandozeile: %s...", query[:80])
 
     # ═══════════════════════════════════════════════════════════════════
     # Query validieren
@@ -468,17 +898,7 @@ python main.py --query-file queries/coenzym_q10.txt --source pubmed --verbose
         export_results(results, args.output)
     else:
         # Zeige Ergebnisse im Terminal an
-        if results:
-            logger.info("\n" + "=" * 80)
-            logger.info(f"ERGEBNISSE ({len(results)} Artikel)")
-            logger.info("=" * 80 + "\n")
-
-            for i, result in enumerate(results[:5], 1):
-                logger.info(f"{i}. {result.get('title', 'N/A')}")
-                logger.info(f" Authors: {result.get('authors', 'N/A')}")
-                logger.info(f" Year: {result.get('year', 'N/A')}")
-                logger.info(f" DOI: {result.get('doi', 'N/A')}")
-                logger.info("")  # Leerzeile für bessere Lesbarkeit
+        print_results(results)
 
     # ═══════════════════════════════════════════════════════════════════
     # Programm erfolgreich beendet
@@ -39,15 +39,110 @@ python src/core/boolean_parser.py queries.txt --format json
 
 import re
 import sys
+import io
 import json
 import argparse
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 # VERSION INFORMATION
 VERSION = "v1.2.1"
 LAST_UPDATED = "2025-12-22"
 
+# PRECOMPILED PATTERNS
+# Compiled once at import time so the hot per-token functions below
+# don't pay for the re module's cache lookup on every call.
+#
+# Token scanner used by tokenize(). Alternatives are tried in order:
+# [()]                        = A single parenthesis
+# "[^"]*(?:"(?:\[[^\]]*\]?)?)? = Double-quoted part, optionally followed
+#                               by a field code like [MeSH]
+# '[^']*(?:'(?:\[[^\]]*\]?)?)? = Same for single quotes
+# [^\s()]+                    = A plain word (operators, plain terms)
+# An unterminated quote or bracket runs to the end of the query,
+# exactly like the original character-by-character scanner did.
+_TOKEN_RE = re.compile(
+    r'[()]'
+    r'|"[^"]*(?:"(?:\[[^\]]*\]?)?)?'
+    r"|'[^']*(?:'(?:\[[^\]]*\]?)?)?"
+    r'|[^\s()]+'
+)
+
+# Fast-path scanner for queries without quotes: only parentheses and
+# plain words can occur, so the quote alternatives are never needed.
+_SIMPLE_TOKEN_RE = re.compile(r'[()]|[^\s()]+')
+
+# Batch scanner used by parse_queries(). Same alternatives as _TOKEN_RE,
+# but a quote or bracket never runs past a line break, and each \n is
+# returned as its own token so the result can be split back into lines.
+_BATCH_TOKEN_RE = re.compile(
+    r'\n'
+    r'|[()]'
+    r'|"[^"\n]*(?:"(?:\[[^\]\n]*\]?)?)?'
+    r"|'[^'\n]*(?:'(?:\[[^\]\n]*\]?)?)?"
+    r'|[^\s()]+'
+)
+
+# VALIDATOR STATE MACHINE
+# validate_single_line() walks the tokens through this small table instead
+# of a chain of if/elif string comparisons.
+#
+# Token kinds (columns): what the current token is
+_KIND_OPERAND = 0   # A term: plain word, quoted phrase or field-term
+_KIND_OPERATOR = 1  # AND / OR
+_KIND_OPEN = 2      # (
+_KIND_CLOSE = 3     # )
+
+# Anything not listed here is an operand
+_TOKEN_KINDS = {
+    'AND': _KIND_OPERATOR,
+    'OR': _KIND_OPERATOR,
+    '(': _KIND_OPEN,
+    ')': _KIND_CLOSE,
+}
+
+# States (rows): what the previous token was
+_STATE_NONE = 0      # Start of query or just after (
+_STATE_OPERAND = 1   # After a term or )
+_STATE_OPERATOR = 2  # After AND / OR
+_INVALID = 3         # Syntax error seen - stays here until the end
+
+# _TRANSITIONS[state][kind] -> next state
+_TRANSITIONS = (
+    #  operand          operator          (             )
+    (_STATE_OPERAND, _INVALID,        _STATE_NONE, _STATE_OPERAND),  # none
+    (_INVALID,       _STATE_OPERATOR, _INVALID,    _STATE_OPERAND),  # operand
+    (_STATE_OPERAND, _INVALID,        _STATE_NONE, _INVALID),        # operator
+    (_INVALID,       _INVALID,        _INVALID,    _INVALID),        # invalid
+)
+
+# Error message for each transition into _INVALID, keyed by (state, kind)
+# {prev} and {token} are the two tokens where the problem was found
+_EXPLAIN = {
+    (_STATE_NONE, _KIND_OPERATOR): 'Operator after opening parenthesis: {prev} {token}',
+    (_STATE_OPERAND, _KIND_OPERAND): 'Missing operator between terms: {prev} {token}',
+    (_STATE_OPERAND, _KIND_OPEN): 'Missing operator before parenthesis: {prev} {token}',
+    (_STATE_OPERATOR, _KIND_OPERATOR): 'Double operator: {prev} {token}',
+    (_STATE_OPERATOR, _KIND_CLOSE): 'Operator before closing parenthesis: {prev} {token}',
+}
+
+# Parenthesis depth change per token kind
+_DEPTH_DELTA = (0, 0, 1, -1)
+
+# TOKEN SETS
+# Built once so membership tests are O(1) hash lookups instead of
+# allocating and scanning a new list literal for every token
+_OPERATORS = frozenset(('AND', 'OR'))
+_PARENS = frozenset(('(', ')'))
+
+# Characters allowed in a field code like MeSH, TIAB or pdat.
+# is_field_term() checks field-terms by hand with this set instead of
+# running a regular expression for every token.
+_FIELD_CODE_CHARS = frozenset(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_'
+)
+
 
 # ============================================================================
 # SECTION 1: CORE PARSING FUNCTIONS
@@ -55,6 +150,7 @@ LAST_UPDATED = "2025-12-22"
 # These functions validate and analyze boolean queries
 # VERSION: v1.2.1
 
+@lru_cache(maxsize=4096)
 def is_field_term(token):
     """
     WHAT THIS FUNCTION DOES:
@@ -65,7 +161,14 @@ def is_field_term(token):
     database fields (like Medical Subject Headings, Title/Abstract, etc.)
     
     HOW IT WORKS:
-    Uses a pattern to check: must have quotes, content, and brackets
+    Checks the parts of "content"[CODE] directly, cheapest checks first:
+    1. Ends with ] and starts with " or '
+    2. The last [ comes right after the matching closing quote,
+       with at least one character of content in between
+    3. The field code between [ and ] is not empty and only uses
+       letters, numbers and underscore
+    4. No line break inside
+    Most tokens (AND, OR, plain words) fail at step 1 right away.
     
     EXAMPLES OF VALID FIELD-TERMS:
     ✅ "cancer"[MeSH]       → True (double quotes + field code)
@@ -84,17 +187,29 @@ def is_field_term(token):
     RETURNS:
     bool: True if this is a valid field-term, False otherwise
     
+    NOTE:
+    Results are cached - batch files tend to repeat the same field-terms
+    
     VERSION: v1.2.1
     """
-    # Pattern explanation:
-    # ([\"\'])     = Start with either " or '
-    # (.+?)        = Content in the middle (at least 1 character)
-    # \1           = Same quote type as the start
-    # \[           = Opening bracket [
-    # ([A-Za-z0-9_]+) = Field code (letters, numbers, underscore)
-    # \]           = Closing bracket ]
-    pattern = r'^([\"\'])(.+?)\1\[([A-Za-z0-9_]+)\]$'
-    return bool(re.match(pattern, token))
+    # Shortest possible field-term is "x"[y] (6 characters)
+    if len(token) < 6:
+        return False
+    if token[-1] != ']':
+        # The original re.match('...$') also accepted ONE trailing line
+        # break ("$" matches right before it) - keep that behavior
+        return token[-1] == '\n' and token[-2] == ']' and is_field_term(token[:-1])
+    quote = token[0]
+    if quote != '"' and quote != "'":
+        return False
+    
+    # The field code can't contain [, so its bracket is the last one
+    bracket = token.rfind('[')
+    return (bracket >= 3
+            and token[bracket - 1] == quote
+            and bracket < len(token) - 2
+            and _FIELD_CODE_CHARS.issuperset(token[bracket + 1:-1])
+            and '\n' not in token)
 
 
 def tokenize(query):
@@ -108,8 +223,8 @@ def tokenize(query):
     Field-terms like "cancer"[MeSH] must stay together as one unit.
     
     HOW IT WORKS:
-    1. Reads through the query character by character
-    2. Groups characters into tokens
+    1. Scans the query with one precompiled regular expression
+    2. Each match is one token (parenthesis, quoted part or word)
     3. Special handling for quoted content and field-codes
     
     EXAMPLES:
@@ -127,60 +242,14 @@ def tokenize(query):
     
     VERSION: v1.2.1
     """
-    tokens = []
-    i = 0
-    
-    # Loop through each character in the query
-    while i < len(query):
-        # Skip whitespace (spaces, tabs, newlines)
-        if query[i].isspace():
-            i += 1
-        # Parentheses are individual tokens
-        elif query[i] in '()':
-            tokens.append(query[i])
-            i += 1
-        # Handle quoted strings (with optional field codes)
-        elif query[i] in '"\'':
-            quote = query[i]
-            quoted_part = quote
-            i += 1
-            
-            # Collect characters until closing quote
-            while i < len(query) and query[i] != quote:
-                quoted_part += query[i]
-                i += 1
-            
-            # Add the closing quote
-            if i < len(query):
-                quoted_part += query[i]
-                i += 1
-            
-            # Check for field code after the quote (like [MeSH])
-            if i < len(query) and query[i] == '[':
-                bracket_part = '['
-                i += 1
-                # Collect field code content
-                while i < len(query) and query[i] != ']':
-                    bracket_part += query[i]
-                    i += 1
-                # Add closing bracket
-                if i < len(query):
-                    bracket_part += query[i]
-                    i += 1
-                quoted_part += bracket_part
-            
-            tokens.append(quoted_part)
-        # Handle regular words (operators, plain terms)
-        else:
-            word = ''
-            # Collect characters until whitespace or special char
-            while i < len(query) and not query[i].isspace() and query[i] not in '()':
-                word += query[i]
-                i += 1
-            if word:
-                tokens.append(word)
-    
-    return tokens
+    # Fast path: without quotes there are no phrases or field-terms,
+    # just parentheses and words (a [ only matters after a quote)
+    if '"' not in query and "'" not in query:
+        return _SIMPLE_TOKEN_RE.findall(query)
+    
+    # One pass of the precompiled scanner (see _TOKEN_RE above);
+    # whitespace between tokens is skipped because no alternative matches it
+    return _TOKEN_RE.findall(query)
 
 
 def validate_single_line(query):
@@ -201,7 +270,7 @@ def validate_single_line(query):
     
     HOW IT WORKS:
     • Tokenizes the query
-    • Checks each rule one by one
+    • Walks the tokens through a small state table (see _TRANSITIONS)
     • Returns True only if ALL rules pass
     
     EXAMPLES:
@@ -223,63 +292,93 @@ def validate_single_line(query):
     
     VERSION: v1.2.1
     """
-    tokens = tokenize(query)
+    return _validate_tokens(tokenize(query))[0]
+
+
+def _validate_tokens(tokens):
+    """
+    WHAT THIS FUNCTION DOES:
+    Applies the validate_single_line() rules to an already tokenized query
+    and explains the first problem it finds
+    
+    WHY IT MATTERS:
+    parse_query() needs the tokens anyway, so it tokenizes once and
+    validates the result here instead of tokenizing a second time.
+    The error message is collected during the same walk, so invalid
+    queries don't need a second pass to explain what went wrong.
+    
+    WHICH ERROR IS REPORTED:
+    If a query has several problems, the first one in this list wins:
+    1. Cannot start with operator: AND
+    2. Cannot end with operator: OR
+    3. Double operator: AND OR
+    4. Unbalanced parentheses
+    5. The first invalid token pair (see _EXPLAIN above)
     
+    PARAMETERS:
+    tokens (list): Tokens as returned by tokenize()
+    
+    RETURNS:
+    tuple: (is_valid, error) - error is None for valid queries
+    
+    VERSION: v1.2.1
+    """
     # Rule 1: Must have at least one token
     if not tokens:
-        return False
+        return False, 'Empty query'
     
     # Rule 2: Cannot start with operator
-    if tokens[0] in ['AND', 'OR']:
-        return False
+    if tokens[0] in _OPERATORS:
+        return False, f'Cannot start with operator: {tokens[0]}'
     
     # Rule 3: Cannot end with operator
-    if tokens[-1] in ['AND', 'OR']:
-        return False
+    if tokens[-1] in _OPERATORS:
+        return False, f'Cannot end with operator: {tokens[-1]}'
     
-    # Rule 4 & 5: Check token sequence
-    prev_token_type = None
+    # Rule 4 & 5: Check token sequence with the transition table
+    state = _STATE_NONE
     paren_depth = 0
+    unbalanced = False
+    sequence_error = None
+    prev_token = None
+    prev_kind = None
+    
+    # Local names are faster than global lookups inside the loop,
+    # which runs once per token for every query in a batch file
+    kind_of = _TOKEN_KINDS.get
+    transitions = _TRANSITIONS
+    depth_delta = _DEPTH_DELTA
     
     for token in tokens:
-        if token == '(':
-            # Parenthesis must not follow an operand directly
-            if prev_token_type == 'operand':
-                return False
-            paren_depth += 1
-            prev_token_type = None
-        elif token == ')':
-            # Parenthesis must follow an operand or nothing
-            if prev_token_type not in ['operand', None]:
-                return False
-            paren_depth -= 1
+        kind = kind_of(token, _KIND_OPERAND)
+        if kind == _KIND_OPERAND:
+            # Most tokens are terms: they can't form a double operator
+            # and don't change the parenthesis depth, so skip both checks
+            next_state = transitions[state][_KIND_OPERAND]
+        else:
+            # Double operators are reported first, wherever they occur
+            if kind == _KIND_OPERATOR and prev_kind == _KIND_OPERATOR:
+                return False, f'Double operator: {prev_token} {token}'
+            next_state = transitions[state][kind]
+            paren_depth += depth_delta[kind]
             # Check for unbalanced parentheses
             if paren_depth < 0:
-                return False
-            prev_token_type = 'operand'
-        elif token in ['AND', 'OR']:
-            # Operator must follow an operand
-            if prev_token_type != 'operand':
-                return False
-            prev_token_type = 'operator'
-        else:
-            # This is an operand (term)
-            # Operand must not follow another operand directly
-            if prev_token_type == 'operand':
-                return False
-            # Check if it's a field-term, quoted phrase, or plain term
-            if is_field_term(token):
-                prev_token_type = 'operand'
-            elif token.startswith('"') and token.endswith('"'):
-                prev_token_type = 'operand'
-            elif token.startswith("'") and token.endswith("'"):
-                prev_token_type = 'operand'
-            else:
-                prev_token_type = 'operand'
+                unbalanced = True
+        if next_state == _INVALID and state != _INVALID:
+            # Remember only the first invalid token pair
+            sequence_error = _EXPLAIN[state, kind].format(prev=prev_token, token=token)
+        state = next_state
+        prev_token = token
+        prev_kind = kind
     
     # Final checks: parentheses must be balanced, must end with operand
-    return paren_depth == 0 and prev_token_type == 'operand'
-
+    if unbalanced or paren_depth != 0:
+        return False, 'Unbalanced parentheses'
+    if sequence_error:
+        return False, sequence_error
+    if state != _STATE_OPERAND:
+        return False, 'Invalid query syntax'
+    return True, None
 
 def validate_multiline(query):
     """
@@ -330,8 +429,9 @@ def parse_query(query):
     HOW IT WORKS:
     1. Checks if query is empty
     2. Determines if single-line or multi-line
-    3. Validates the syntax
-    4. Returns detailed results
+    3. Joins the lines and tokenizes once
+    4. Validates the tokens
+    5. Returns detailed results
     
     EXAMPLE USAGE:
     result = parse_query('"cancer"[MeSH] AND treatment')
@@ -352,6 +452,23 @@ def parse_query(query):
     - 'tokens' (list): List of tokens
     - 'error' (str or None): Error message if invalid
     
+    NOTE:
+    Results are cached per query text, so repeated queries (common in
+    batch files) are only parsed once. Each call returns its own copy.
+    
+    VERSION: v1.2.1
+    """
+    result = _parse_query_cached(query)
+    # Copy so callers can't change the cached entry
+    return dict(result, tokens=list(result['tokens']))
+
+
+@lru_cache(maxsize=4096)
+def _parse_query_cached(query):
+    """
+    WHAT THIS FUNCTION DOES:
+    Does the actual work for parse_query(); results are cached by query text
+    
     VERSION: v1.2.1
     """
     # Check for empty query
@@ -369,34 +486,19 @@ def parse_query(query):
     query_format = 'MULTI_LINE' if is_multiline else 'SINGLE_LINE'
     
     try:
-        # Validate appropriate to query type
-        if is_multiline:
-            is_valid = validate_multiline(query)
-        else:
-            is_valid = validate_single_line(query)
+        # Tokenize once - the same tokens are validated and returned
+        combined = ' '.join(line.strip() for line in query.split('\n') if line.strip())
+        tokens = tokenize(combined)
         
-        if is_valid:
-            # Query is valid - extract tokens
-            combined = ' '.join(line.strip() for line in query.split('\n') if line.strip())
-            tokens = tokenize(combined)
-            return {
-                'success': True,
-                'format': query_format,
-                'query': query,
-                'tokens': tokens,
-                'error': None
-            }
-        else:
-            # Query is invalid - generate error message
-            tokens = tokenize(query)
-            error = get_validation_error(query, tokens)
-            return {
-                'success': False,
-                'format': query_format,
-                'query': query,
-                'tokens': tokens,
-                'error': error
-            }
+        # Validate - the error message comes from the same pass
+        is_valid, error = _validate_tokens(tokens)
+        return {
+            'success': is_valid,
+            'format': query_format,
+            'query': query,
+            'tokens': tokens,
+            'error': error
+        }
     except Exception as e:
         # Unexpected error
         return {
@@ -408,50 +510,66 @@ def parse_query(query):
         }
 
 
-def get_validation_error(query, tokens):
+def parse_queries(queries):
     """
     WHAT THIS FUNCTION DOES:
-    Determines the specific validation error for a failing query
+    Parses a whole list of queries at once (e.g. all lines of a query file)
     
     WHY IT MATTERS:
-    Users need to know WHAT is wrong with their query to fix it
+    Calling parse_query() once per line costs a function call, a cache
+    lookup and a dict copy for every query. For large files that overhead
+    is bigger than the actual parsing work.
     
     HOW IT WORKS:
-    Checks each possible error type and returns the first one found
+    1. Joins all single-line queries with \n into one text
+    2. Tokenizes that text with one regex sweep
+    3. Splits the tokens back into one list per query at each \n
+    4. Validates each token list
+    Empty and multi-line queries are handed to parse_query() instead.
+    
+    PARAMETERS:
+    queries (list): List of query strings
     
     RETURNS:
-    str: Human-readable error message
+    list: One result dict per query, same format as parse_query()
     
     VERSION: v1.2.1
     """
-    if not tokens:
-        return 'Empty query'
-    
-    if tokens[0] in ['AND', 'OR']:
-        return f'Cannot start with operator: {tokens[0]}'
+    results = [None] * len(queries)
     
-    if tokens[-1] in ['AND', 'OR']:
-        return f'Cannot end with operator: {tokens[-1]}'
+    # Queries that can share the sweep; the rest go through parse_query()
+    batch = []
+    for i, query in enumerate(queries):
+        if '\n' not in query and query.strip():
+            batch.append(i)
+        else:
+            results[i] = parse_query(query)
     
-    # Check for double operators
-    for i in range(len(tokens) - 1):
-        if tokens[i] in ['AND', 'OR'] and tokens[i + 1] in ['AND', 'OR']:
-            return f'Double operator: {tokens[i]} {tokens[i + 1]}'
+    if not batch:
+        return results
     
-    # Check for unbalanced parentheses
-    paren_depth = 0
-    for token in tokens:
-        if token == '(':
-            paren_depth += 1
-        elif token == ')':
-            paren_depth -= 1
-            if paren_depth < 0:
-                return 'Unbalanced parentheses'
+    # One sweep over all queries, split into per-query token lists
+    tokens = []
+    token_lists = [tokens]
+    big = '\n'.join(queries[i].strip() for i in batch)
+    for token in _BATCH_TOKEN_RE.findall(big):
+        if token == '\n':
+            tokens = []
+            token_lists.append(tokens)
+        else:
+            tokens.append(token)
     
-    if paren_depth != 0:
-        return 'Unbalanced parentheses'
+    for i, tokens in zip(batch, token_lists):
+        is_valid, error = _validate_tokens(tokens)
+        results[i] = {
+            'success': is_valid,
+            'format': 'SINGLE_LINE',
+            'query': queries[i],
+            'tokens': tokens,
+            'error': error
+        }
     
-    return 'Invalid query syntax'
+    return results
 
 
 def get_query_info(query):
@@ -483,10 +601,33 @@ def get_query_info(query):
     
     VERSION: v1.2.1
     """
-    tokens = tokenize(query)
-    field_terms = [t for t in tokens if is_field_term(t)]
-    operators = [t for t in tokens if t in ['AND', 'OR']]
-    operands = [t for t in tokens if t not in ['AND', 'OR', '(', ')'] and not is_field_term(t)]
+    return _query_info_from_tokens(tokenize(query))
+
+
+def _query_info_from_tokens(tokens):
+    """
+    WHAT THIS FUNCTION DOES:
+    Builds the get_query_info() dict from already tokenized input
+    
+    WHY IT MATTERS:
+    main() has the tokens from parse_query() at hand, so it passes them
+    in instead of tokenizing every query a second time.
+    
+    PARAMETERS:
+    tokens (list): Tokens of a valid query, as returned by parse_query()
+    
+    VERSION: v1.2.1
+    """
+    field_terms, operators, operands = [], [], []
+    
+    # One pass over the tokens, checking each token only once
+    for t in tokens:
+        if is_field_term(t):
+            field_terms.append(t)
+        elif t in _OPERATORS:
+            operators.append(t)
+        elif t not in _PARENS:
+            operands.append(t)
     
     return {
         'tokens': tokens,
@@ -550,7 +691,7 @@ def read_queries_from_file(filepath):
         sys.exit(1)
 
 
-def create_log_filename(log_dir='tests/logs'):
+def create_log_filename(log_dir='tests/logs', now=None):
     """
     WHAT THIS FUNCTION DOES:
     Creates meaningful log filenames with date/time stamps
@@ -568,6 +709,7 @@ def create_log_filename(log_dir='tests/logs'):
     
     PARAMETERS:
     log_dir (str): Directory to save logs (default: tests/logs)
+    now (datetime): Time for the stamp (default: current time)
     
     RETURNS:
     dict: {'txt': filename, 'json': filename}
@@ -576,24 +718,27 @@ def create_log_filename(log_dir='tests/logs'):
     """
     # Create directory if it doesn't exist
     Path(log_dir).mkdir(parents=True, exist_ok=True)
+    if now is None:
+        now = datetime.now()
     # Generate timestamp (YYYYMMDD_HHMMSS)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
     return {
         'txt': f"{log_dir}/PARSER_RESULTS_{timestamp}.txt",
         'json': f"{log_dir}/PARSER_RESULTS_{timestamp}.json"
     }
 
 
-def format_layperson_log(queries_data):
+def write_layperson_log(queries_data, out=None, now=None):
     """
     WHAT THIS FUNCTION DOES:
-    Creates a detailed, easy-to-understand report for non-technical users
+    Writes a detailed, easy-to-understand report for non-technical users
     
     WHY IT MATTERS:
     Users need to understand results in plain English, not technical jargon
     
     HOW IT WORKS:
-    Formats query results with:
+    Writes the report line by line to a file (or the console), so the
+    full text is never held in memory at once. Formats query results with:
     • Clear status indicators (✅ VALID / ❌ INVALID)
     • Plain English explanations
     • Examples of correct/incorrect syntax
@@ -601,127 +746,170 @@ def format_layperson_log(queries_data):
     
     PARAMETERS:
     queries_data (list): Results from parse_query() for each query
+    out (file): Open text file to write to (default: sys.stdout)
+    now (datetime): Time shown as "Generated" (default: current time)
     
     RETURNS:
-    str: Formatted report text
+    None
     
     VERSION: v1.2.1
     """
-    log = []
+    if out is None:
+        out = sys.stdout
+    if now is None:
+        now = datetime.now()
+    
+    def log(line):
+        out.write(line)
+        out.write('\n')
     
     # ========== REPORT HEADER ==========
-    log.append("=" * 80)
-    log.append("BOOLEAN QUERY PARSER - RESULTS REPORT")
-    log.append("=" * 80)
-    log.append("")
-    log.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    log.append(f"Version: {VERSION}")
-    log.append("")
+    log("=" * 80)
+    log("BOOLEAN QUERY PARSER - RESULTS REPORT")
+    log("=" * 80)
+    log("")
+    log(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    log(f"Version: {VERSION}")
+    log("")
     
     # ========== STATISTICS SUMMARY ==========
     passed = sum(1 for q in queries_data if q['result']['success'])
     failed = len(queries_data) - passed
     
-    log.append("=" * 80)
-    log.append("SUMMARY")
-    log.append("=" * 80)
-    log.append(f"Total Queries Tested: {len(queries_data)}")
-    log.append(f"✅ Valid Queries: {passed}")
-    log.append(f"❌ Invalid Queries: {failed}")
+    log("=" * 80)
+    log("SUMMARY")
+    log("=" * 80)
+    log(f"Total Queries Tested: {len(queries_data)}")
+    log(f"✅ Valid Queries: {passed}")
+    log(f"❌ Invalid Queries: {failed}")
     if len(queries_data) > 0:
         success_rate = (passed / len(queries_data)) * 100
-        log.append(f"Success Rate: {success_rate:.1f}%")
-    log.append("")
+        log(f"Success Rate: {success_rate:.1f}%")
+    log("")
     
     # ========== DETAILED RESULTS FOR EACH QUERY ==========
-    log.append("=" * 80)
-    log.append("DETAILED RESULTS")
-    log.append("=" * 80)
-    log.append("")
+    log("=" * 80)
+    log("DETAILED RESULTS")
+    log("=" * 80)
+    log("")
     
     for q_data in queries_data:
         query = q_data['query']
         result = q_data['result']
-        info = q_data['info']
         
         status = "✅ VALID" if result['success'] else "❌ INVALID"
-        log.append(f"Query #{q_data.get('line', '?')}: {status}")
-        log.append(f"  Query: {query}")
+        log(f"Query #{q_data.get('line', '?')}: {status}")
+        log(f"  Query: {query}")
         
         if result['success']:
             # Show details for valid queries
-            log.append(f"  Format: {result['format']}")
-            log.append(f"  Tokens: {', '.join(result['tokens'])}")
+            log(f"  Format: {result['format']}")
+            log(f"  Tokens: {', '.join(result['tokens'])}")
             
+            info = q_data['info']
             if info['field_terms']:
-                log.append(f"  Field-Specific Terms Found: {len(info['field_terms'])}")
+                log(f"  Field-Specific Terms Found: {len(info['field_terms'])}")
                 for ft in info['field_terms']:
-                    log.append(f"    • {ft}")
+                    log(f"    • {ft}")
             
             if info['operators']:
-                log.append(f"  Operators Used: {', '.join(info['operators'])}")
+                log(f"  Operators Used: {', '.join(info['operators'])}")
         else:
             # Show error explanation for invalid queries
-            log.append(f"  Error: {result['error']}")
-            log.append(f"  Explanation:")
+            log(f"  Error: {result['error']}")
+            log(f"  Explanation:")
             
             error = result['error']
             if 'Cannot start with operator' in error:
-                log.append(f"    A query cannot begin with AND or OR.")
-                log.append(f"    Example: ❌ AND cancer")
-                log.append(f"    Fix: ✅ cancer AND treatment")
+                log(f"    A query cannot begin with AND or OR.")
+                log(f"    Example: ❌ AND cancer")
+                log(f"    Fix: ✅ cancer AND treatment")
             elif 'Cannot end with operator' in error:
-                log.append(f"    A query cannot end with AND or OR.")
-                log.append(f"    Example: ❌ cancer AND")
-                log.append(f"    Fix: ✅ cancer AND treatment")
+                log(f"    A query cannot end with AND or OR.")
+                log(f"    Example: ❌ cancer AND")
+                log(f"    Fix: ✅ cancer AND treatment")
             elif 'Double operator' in error:
-                log.append(f"    Two operators cannot appear next to each other.")
-                log.append(f"    Example: ❌ cancer AND AND treatment")
-                log.append(f"    Fix: ✅ cancer AND treatment")
+                log(f"    Two operators cannot appear next to each other.")
+                log(f"    Example: ❌ cancer AND AND treatment")
+                log(f"    Fix: ✅ cancer AND treatment")
             elif 'Unbalanced parentheses' in error:
-                log.append(f"    Every opening parenthesis must have a closing one.")
-                log.append(f"    Example: ❌ (cancer AND tumor")
-                log.append(f"    Fix: ✅ (cancer AND tumor)")
+                log(f"    Every opening parenthesis must have a closing one.")
+                log(f"    Example: ❌ (cancer AND tumor")
+                log(f"    Fix: ✅ (cancer AND tumor)")
+            elif 'Missing operator' in error:
+                log(f"    Two terms or groups need AND or OR between them.")
+                log(f"    Example: ❌ cancer treatment")
+                log(f"    Fix: ✅ cancer AND treatment")
+            elif 'Operator after opening parenthesis' in error:
+                log(f"    A group cannot begin with AND or OR.")
+                log(f"    Example: ❌ (AND cancer)")
+                log(f"    Fix: ✅ (cancer AND tumor)")
+            elif 'Operator before closing parenthesis' in error:
+                log(f"    A group cannot end with AND or OR.")
+                log(f"    Example: ❌ (cancer AND)")
+                log(f"    Fix: ✅ (cancer AND tumor)")
         
-        log.append("")
+        log("")
     
     # ========== EXPLANATIONS ==========
-    log.append("=" * 80)
-    log.append("WHAT DO THESE RESULTS MEAN?")
-    log.append("=" * 80)
-    log.append("")
-    log.append("VALID QUERY (✅)")
-    log.append("  Your query follows proper boolean search syntax.")
-    log.append("  It can be used to search PubMed or other databases.")
-    log.append("")
-    log.append("INVALID QUERY (❌)")
-    log.append("  Your query has a syntax error (see explanation above).")
-    log.append("  Fix the error before using it in a database search.")
-    log.append("")
-    log.append("FIELD-SPECIFIC TERMS")
-    log.append("  Terms like \"cancer\"[MeSH] restrict searches to specific fields.")
-    log.append("  [MeSH] searches the Medical Subject Headings")
-    log.append("  [TIAB] searches Title and Abstract")
-    log.append("  [pdat] searches publication date")
-    log.append("")
+    log("=" * 80)
+    log("WHAT DO THESE RESULTS MEAN?")
+    log("=" * 80)
+    log("")
+    log("VALID QUERY (✅)")
+    log("  Your query follows proper boolean search syntax.")
+    log("  It can be used to search PubMed or other databases.")
+    log("")
+    log("INVALID QUERY (❌)")
+    log("  Your query has a syntax error (see explanation above).")
+    log("  Fix the error before using it in a database search.")
+    log("")
+    log("FIELD-SPECIFIC TERMS")
+    log("  Terms like \"cancer\"[MeSH] restrict searches to specific fields.")
+    log("  [MeSH] searches the Medical Subject Headings")
+    log("  [TIAB] searches Title and Abstract")
+    log("  [pdat] searches publication date")
+    log("")
     
     # ========== TIPS ==========
-    log.append("=" * 80)
-    log.append("TIPS FOR BETTER SEARCHES")
-    log.append("=" * 80)
-    log.append("")
-    log.append("• Use quotes around multi-word terms: \"lung cancer\"")
-    log.append("• Use AND to require multiple terms: cancer AND treatment")
-    log.append("• Use OR to include alternative terms: cancer OR tumor")
-    log.append("• Use parentheses to group: (cancer OR tumor) AND treatment")
-    log.append("• Use field codes for precise searches: \"cancer\"[MeSH]")
-    log.append("")
+    log("=" * 80)
+    log("TIPS FOR BETTER SEARCHES")
+    log("=" * 80)
+    log("")
+    log("• Use quotes around multi-word terms: \"lung cancer\"")
+    log("• Use AND to require multiple terms: cancer AND treatment")
+    log("• Use OR to include alternative terms: cancer OR tumor")
+    log("• Use parentheses to group: (cancer OR tumor) AND treatment")
+    log("• Use field codes for precise searches: \"cancer\"[MeSH]")
+    log("")
+    
+    log("=" * 80)
+    log("END OF REPORT")
+    log("=" * 80)
+
+
+def format_layperson_log(queries_data, now=None):
+    """
+    WHAT THIS FUNCTION DOES:
+    Creates the write_layperson_log() report as one string
+    
+    WHY IT MATTERS:
+    Callers that want the report text itself (to show it, send it or
+    save it elsewhere) get it without handling a file object
+    
+    PARAMETERS:
+    queries_data (list): Results from parse_query() for each query
+    now (datetime): Time shown as "Generated" (default: current time)
     
-    log.append("=" * 80)
-    log.append("END OF REPORT")
-    log.append("=" * 80)
+    RETURNS:
+    str: Formatted report text
     
-    return '\n'.join(log)
+    VERSION: v1.2.1
+    """
+    buffer = io.StringIO()
+    write_layperson_log(queries_data, buffer, now=now)
+    # Same text as before streaming: lines joined, no final line break
+    return buffer.getvalue()[:-1]
 
 
 # ============================================================================
@@ -774,6 +962,9 @@ EXAMPLES:
   4. Verbose output:
      python src/core/boolean_parser.py queries.txt --verbose
 
+  5. Indented (human-readable) JSON log:
+     python src/core/boolean_parser.py queries.txt --pretty
+
 FILE FORMAT:
   Create a text file with one query per line:
   
@@ -808,6 +999,12 @@ OUTPUT:
         help='Show detailed output'
     )
     
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent the JSON log for reading (default: compact)'
+    )
+    
     parser.add_argument(
         '--format', '-f',
         choices=['txt', 'json'],
@@ -818,6 +1015,35 @@ OUTPUT:
     return parser
 
 
+def is_query_file(query_arg):
+    """
+    WHAT THIS FUNCTION DOES:
+    Decides whether the command-line argument is a query file or a query
+    
+    WHY IT MATTERS:
+    A file must always be read as a file, whatever its name looks like
+    (e.g. "cancer AND tumor.txt" or 'my "best" queries.txt').
+    
+    HOW IT WORKS:
+    1. If the argument is an existing file → it's a query file
+    2. Otherwise it's a query string. Long queries can be too long for a
+       file name; the file system then raises OSError ("File name too
+       long"), which also means: not a file
+    
+    PARAMETERS:
+    query_arg (str): The argument given on the command line
+    
+    RETURNS:
+    bool: True if query_arg is an existing file
+    
+    VERSION: v1.2.1
+    """
+    try:
+        return Path(query_arg).is_file()
+    except OSError:
+        return False
+
+
 def main():
     """
     WHAT THIS FUNCTION DOES:
@@ -850,10 +1076,12 @@ def main():
         parser.print_help()
         return
     
-    # Determine if input is a file or a single query
-    input_path = Path(args.query)
+    # Determine if input is a file or a single query.
+    # An existing file always wins - even if its name contains quotes or
+    # " AND " (see is_query_file)
+    is_file_input = is_query_file(args.query)
     
-    if input_path.exists() and input_path.is_file():
+    if is_file_input:
         # Input is a file - read queries from it
         queries_list = read_queries_from_file(args.query)
     else:
@@ -861,12 +1089,14 @@ def main():
         queries_list = [{'line': 1, 'query': args.query}]
     
     # ========== PROCESS EACH QUERY ==========
+    # Parse and validate all queries in one batch
+    results = parse_queries([q_data['query'] for q_data in queries_list])
+    
     queries_data = []
-    for q_data in queries_list:
-        # Parse and validate the query
-        result = parse_query(q_data['query'])
-        # Extract information if query is valid
-        info = get_query_info(q_data['query']) if result['success'] else {}
+    for q_data, result in zip(queries_list, results):
+        # Extract query info once from the parsed tokens; the text log,
+        # JSON log and console output all read it from here
+        info = _query_info_from_tokens(result['tokens']) if result['success'] else {}
         
         # Store results
         queries_data.append({
@@ -883,17 +1113,18 @@ def main():
             print(f"   Error: {result['error']}")
     
     # ========== GENERATE LOG FILES ==========
-    log_files = create_log_filename()
+    # One timestamp for the file names, both reports and the JSON log
+    now = datetime.now()
+    log_files = create_log_filename(now=now)
     
     # Create text log (human-readable)
-    txt_log = format_layperson_log(queries_data)
     with open(log_files['txt'], 'w', encoding='utf-8') as f:
-        f.write(txt_log)
+        write_layperson_log(queries_data, f, now=now)
     print(f"\n✅ Text log saved to: {log_files['txt']}")
     
     # Create JSON log (machine-readable)
     json_data = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'version': VERSION,
         'summary': {
             'total': len(queries_data),
@@ -915,12 +1146,19 @@ def main():
     }
     
     with open(log_files['json'], 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2)
+        if args.pretty:
+            json.dump(json_data, f, indent=2)
+        else:
+            # Compact output is much smaller; use --pretty for an indented
+            # file. json.dumps() without indent runs json's C encoder,
+            # json.dump() would always take the pure-Python one
+            f.write(json.dumps(json_data, separators=(',', ':')))
     print(f"✅ JSON log saved to: {log_files['json']}")
     
     # Show detailed output if requested
-    if args.verbose or not input_path.exists():
-        print("\n" + txt_log)
+    if args.verbose or not is_file_input:
+        print()
+        write_layperson_log(queries_data, now=now)
 
 
 # ============================================================================
@@ -13,8 +13,105 @@ Konzepte:
   programmieren MUSS.
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class RateLimiter:
+    """
+    Begrenzt die Anzahl der Anfragen pro Sekunde - auch über Threads hinweg.
+    
+    Jeder Aufruf von wait() reserviert den nächsten freien Zeitpunkt
+    (Abstand 1/requests_per_second) und schläft bis dahin. Mehrere
+    Threads, die sich einen RateLimiter teilen, halten das Limit also
+    gemeinsam ein.
+    
+    Beispiel:
+        limiter = RateLimiter(3)   # NCBI ohne API-Key: max. 3 Requests/s
+        limiter.wait()             # vor jeder Anfrage
+    """
+    
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Wartet, bis die nächste Anfrage erlaubt ist."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _RateLimitedRetry(Retry):
+    """
+    Retry, dessen Wiederholungen ebenfalls durch den RateLimiter laufen.
+    
+    urllib3 wiederholt Anfragen intern (ohne dass der Adapter es merkt)
+    und ruft vor jedem neuen Versuch sleep() auf - genau dort wird
+    zusätzlich auf den RateLimiter gewartet.
+    """
+    
+    def __init__(self, *args, rate_limiter: Optional[RateLimiter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+    
+    def new(self, **kwargs):
+        # urllib3 erzeugt pro Versuch ein neues Retry-Objekt
+        kwargs.setdefault("rate_limiter", self.rate_limiter)
+        return super().new(**kwargs)
+    
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+
+
+def create_http_session(rate_limiter: Optional[RateLimiter] = None) -> requests.Session:
+    """
+    Erstellt eine HTTP-Session für die Datenbank-Adapter.
+    
+    Warum eine Session statt requests.get()?
+    Die Session hält die Verbindung offen (Keep-Alive). Bei mehreren
+    Anfragen an denselben Server (Seiten, ESearch -> ESummary) werden
+    TCP- und TLS-Handshake nur einmal bezahlt statt bei jeder Anfrage.
+    
+    Zusätzlich werden vorübergehende Fehler automatisch wiederholt
+    (429 "Too Many Requests" und 5xx), mit wachsender Wartezeit
+    (sofort, 1s, 2s, ...) - ein Retry-After-Header des Servers hat Vorrang.
+    
+    Argumente:
+        rate_limiter (RateLimiter, optional): Wenn gesetzt, wartet auch
+            jede automatische Wiederholung auf diesen RateLimiter.
+            (Vor der ersten Anfrage muss der Adapter selbst wait() aufrufen.)
+    
+    Rückgabewert:
+        requests.Session: Session mit Retry-Adapter für http:// und https://
+    """
+    retry = _RateLimitedRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Nach dem letzten Versuch die Antwort zurückgeben, damit
+        # raise_for_status() wie bisher einen HTTPError wirft
+        raise_on_status=False,
+        rate_limiter=rate_limiter,
+    )
+    http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount("https://", http_adapter)
+    session.mount("http://", http_adapter)
+    return session
 
 class DatabaseAdapter(ABC):
     """
@@ -24,6 +121,15 @@ class DatabaseAdapter(ABC):
     Klasse erben und die Methode 'search' implementieren.
     """
 
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Argumente:
+            session (requests.Session, optional): HTTP-Session für alle
+                Anfragen dieses Adapters. Standard: eine eigene Session
+                aus create_http_session().
+        """
+        self.session = session if session is not None else create_http_session()
+
     @abstractmethod
     def search(self, query: str, limit: int = 25) -> List[Dict[str, Any]]:
         """
@@ -41,3 +147,24 @@ class DatabaseAdapter(ABC):
                         'url', 'year', etc.
         """
         pass
+
+    def search_iter(self, query: str, limit: int = 25) -> Iterator[Dict[str, Any]]:
+        """
+        Liefert die Suchergebnisse Artikel für Artikel (als Generator).
+
+        So kann das Hauptprogramm jeden Artikel sofort exportieren bzw.
+        anzeigen, statt auf die komplette Ergebnisliste zu warten.
+
+        Standard-Verhalten: ruft search() auf und gibt deren Liste Stück
+        für Stück weiter. Adapter, die seitenweise laden, KÖNNEN diese
+        Methode überschreiben und jede Seite sofort weitergeben.
+
+        Argumente:
+            query (str): Die bereinigte Suchanfrage (z.B. "(A OR B) AND C")
+            limit (int): Maximale Anzahl der Ergebnisse (Standard: 25)
+
+        Rückgabewert:
+            Iterator[Dict]: Die Artikel-Dictionaries (gleiche Felder wie
+                            bei search())
+        """
+        yield from self.search(query, limit=limit)
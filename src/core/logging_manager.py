@@ -102,6 +102,7 @@ class LoggingManager:
         self.database = database
         self.logger = None
         self.log_file = None
+        self.console_handler = None
         
         # Führe Setup durch
         self._setup_logging()
@@ -172,6 +173,9 @@ class LoggingManager:
         
         self.logger.addHandler(console_handler)
         
+        # Merken, damit set_verbose() direkt darauf zugreifen kann
+        self.console_handler = console_handler
+        
         
         # ════════════════════════════════════════════════════════════════
         # Startup-Meldungen
@@ -210,18 +214,15 @@ class LoggingManager:
         Args:
             verbose (bool): True = DEBUG Level, False = INFO Level
         """
+        # Der Datei-Handler steht immer auf DEBUG; umgestellt wird nur
+        # die Konsole (direkt über die gemerkte Referenz)
         if verbose:
             self.logger.setLevel(logging.DEBUG)
-            # Aktualisiere auch alle Handler
-            for handler in self.logger.handlers:
-                if isinstance(handler, logging.StreamHandler):
-                    handler.setLevel(logging.DEBUG)
+            self.console_handler.setLevel(logging.DEBUG)
             self.logger.debug("🔍 Verbose Mode aktiviert")
         else:
             self.logger.setLevel(logging.INFO)
-            for handler in self.logger.handlers:
-                if isinstance(handler, logging.StreamHandler):
-                    handler.setLevel(logging.INFO)
+            self.console_handler.setLevel(logging.INFO)
     
     def get_log_file(self) -> Path:
         """
@@ -49,6 +49,20 @@ from typing import Optional
 # Der Logger wird vom LoggingManager zentralverwaltet und konfiguriert
 logger = logging.getLogger(__name__)
 
+# PubMed-Datumsbereich (YYYY:YYYY[pdat]) - einmal beim Import kompiliert
+# (\d{4}):(\d{4})\[pdat\] = Finde (2015:2025[pdat]) und erfasse beide Jahreszahlen
+_PDAT_RANGE_RE = re.compile(r"\((\d{4}):(\d{4})\[pdat\]\)")
+
+
+def _collapse_whitespace(query: str) -> str:
+    r"""
+    Entfernt Extra-Whitespace (mehrere Spaces/Zeilenumbrüche → ein Space).
+
+    Gleiches Ergebnis wie re.sub(r"\s+", " ", query).strip(), aber
+    str.split() + join läuft komplett in C und ist deutlich schneller.
+    """
+    return " ".join(query.split())
+
 
 class QueryCompiler:
     """
@@ -79,7 +93,7 @@ class QueryCompiler:
             pubmed_query = compiler.compile_for_source("pubmed")
         """
         self.original_query = query
-        logger.debug(f"QueryCompiler initialisiert mit: {query[:50]}...")
+        logger.debug("QueryCompiler initialisiert mit: %.50s...", query)
 
     def compile_for_source(self, source: str) -> str:
         """
@@ -150,10 +164,10 @@ class QueryCompiler:
         query = self.original_query
 
         # Entferne Extra-Spaces (mehrere Spaces → ein Space)
-        query = re.sub(r"\s+", " ", query).strip()
+        query = _collapse_whitespace(query)
 
         # [pdat] bleibt erhalten (PubMed versteht das Format)
-        logger.debug(f"PubMed-Query: {query}")
+        logger.debug("PubMed-Query: %s", query)
 
         return query
 
@@ -186,18 +200,16 @@ class QueryCompiler:
         query = self.original_query
 
         # Entferne Extra-Spaces
-        query = re.sub(r"\s+", " ", query).strip()
+        query = _collapse_whitespace(query)
 
         # KONVERTIERUNG: (YYYY:YYYY[pdat]) → PUB_YEAR:(YYYY TO YYYY)
-        # REGEX Pattern-Erklärung:
-        # (\d{4}):(\d{4})\[pdat\] = Finde (2015:2025[pdat]) und erfasse beide Jahreszahlen
-        query = re.sub(
-            r"\((\d{4}):(\d{4})\[pdat\]\)",  # Such-Pattern
+        # (Pattern-Erklärung siehe _PDAT_RANGE_RE oben)
+        query = _PDAT_RANGE_RE.sub(
             r"PUB_YEAR:(\1 TO \2)",  # Ersatz-Pattern mit erfassten Gruppen
             query,
         )
 
-        logger.debug(f"Europe PMC-Query: {query}")
+        logger.debug("Europe PMC-Query: %s", query)
         return query
 
     def _compile_for_cochrane(self) -> str:
@@ -226,13 +238,14 @@ class QueryCompiler:
         query = self.original_query
 
         # Entferne Extra-Spaces
-        query = re.sub(r"\s+", " ", query).strip()
+        query = _collapse_whitespace(query)
 
         # KONVERTIERUNG: (YYYY:YYYY[pdat]) → (YYYY:YYYY)
         # Entfernt das [pdat] Tag für Cochrane
-        query = re.sub(r"\[pdat\]", "", query)
+        # (fester Text - dafür reicht str.replace, keine Regex nötig)
+        query = query.replace("[pdat]", "")
 
-        logger.debug(f"Cochrane-Query: {query}")
+        logger.debug("Cochrane-Query: %s", query)
         return query
 
     def validate_query_syntax(self) -> bool:
@@ -269,19 +282,21 @@ class QueryCompiler:
 
         # PRÜFUNG 2: Gültige Boolean-Operatoren?
         # Erlaubte Keywords: AND, OR, NOT
-        valid_keywords = {"AND", "OR", "NOT"}
+        # Beliebige Begriffe sind OK - die Schleife meldet die gefundenen
+        # Operatoren nur im Debug-Log. Ohne DEBUG-Level wird sie deshalb
+        # gar nicht erst ausgeführt.
+        if logger.isEnabledFor(logging.DEBUG):
+            valid_keywords = {"AND", "OR", "NOT"}
 
-        # Splitte Query in Wörter
-        words = query.upper().split()
+            # Splitte Query in Wörter (einmal in Großbuchstaben umwandeln)
+            words = query.upper().split()
 
-        for word in words:
-            # Entferne Klammern und Sonderzeichen
-            clean_word = word.strip("()").upper()
+            for word in words:
+                # Entferne Klammern und Sonderzeichen
+                clean_word = word.strip("()")
 
-            # Nur Keywords und beliebige Begriffe erlaubt
-            # (Keine weitere Prüfung nötig - beliebige Begriffe OK)
-            if clean_word in valid_keywords:
-                logger.debug(f"Gültiger Operator gefunden: {clean_word}")
+                if clean_word in valid_keywords:
+                    logger.debug("Gültiger Operator gefunden: %s", clean_word)
 
         logger.debug("Query-Syntax validiert ✓")
         return True
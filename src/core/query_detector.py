@@ -79,6 +79,12 @@ class QueryDetector:
         r'JOURNAL:',                # Journal Field
     ]
     
+    # Einmal beim Laden der Klasse kompiliert (statt re.search() mit
+    # Pattern-String pro Marker und Aufruf)
+    _PUBMED_MARKER_RES = tuple(re.compile(m, re.IGNORECASE) for m in PUBMED_MARKERS)
+    _EUROPE_PMC_MARKER_RES = tuple(re.compile(m, re.IGNORECASE) for m in EUROPE_PMC_MARKERS)
+    _UMLAUT_RE = re.compile(r'[äöüß]', re.IGNORECASE)
+    
     # ========== Syntaktische Komplexität ==========
     # Wenn Query viele Operatoren und Klammern hat, ist sie wahrscheinlich formatiert
     OPERATORS = ['AND', 'OR', 'NOT']
@@ -143,10 +149,10 @@ class QueryDetector:
         
         marker_count = 0
         
-        for marker in self.PUBMED_MARKERS:
-            if re.search(marker, query_string, re.IGNORECASE):
+        for marker in self._PUBMED_MARKER_RES:
+            if marker.search(query_string):
                 marker_count += 1
-                logger.debug(f"  PubMed-Marker gefunden: {marker}")
+                logger.debug("  PubMed-Marker gefunden: %s", marker.pattern)
         
         # Mindestens 2 Marker für hohe Confidence
         if marker_count >= 2:
@@ -174,10 +180,10 @@ class QueryDetector:
         
         marker_count = 0
         
-        for marker in self.EUROPE_PMC_MARKERS:
-            if re.search(marker, query_string, re.IGNORECASE):
+        for marker in self._EUROPE_PMC_MARKER_RES:
+            if marker.search(query_string):
                 marker_count += 1
-                logger.debug(f"  Europe PMC-Marker gefunden: {marker}")
+                logger.debug("  Europe PMC-Marker gefunden: %s", marker.pattern)
         
         # Mindestens 1 Marker für Europe PMC
         if marker_count >= 1:
@@ -242,7 +248,7 @@ class QueryDetector:
         """
         
         # ========== Deutsche Umlaute ==========
-        if re.search(r'[äöüß]', query_string, re.IGNORECASE):
+        if self._UMLAUT_RE.search(query_string):
             logger.debug("  Deutsch erkannt: Umlaute vorhanden")
             return True
         
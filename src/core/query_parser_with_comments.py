@@ -21,9 +21,17 @@ Ausgabe-Query (nach Parsing):
 
 import re
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, Union
 
-def load_query_with_comments(filepath: str) -> Tuple[str, str]:
+# Vorkompilierte Ausdrücke (einmal beim Import statt bei jedem Aufruf)
+_WHITESPACE_RE = re.compile(r'\s+')
+_INLINE_COMMENT_RE = re.compile(r"(?<!['\"\\])#.*$")
+
+# Obergrenze für Query-Dateien (1 MB). Echte Queries sind wenige KB groß;
+# größere Dateien sind fast sicher ein Versehen und werden nicht gelesen.
+MAX_QUERY_FILE_SIZE = 1_048_576
+
+def load_query_with_comments(filepath: Union[str, Path]) -> Tuple[str, str]:
     """
     Lädt eine Query aus einer Textdatei mit Comment-Support.
     
@@ -36,14 +44,14 @@ def load_query_with_comments(filepath: str) -> Tuple[str, str]:
     5. Gibt auch die Original-Datei zurück (für Debugging)
     
     Args:
-        filepath (str): Pfad zur Query-Datei
+        filepath (str | Path): Pfad zur Query-Datei
         
     Returns:
         Tuple[str, str]: (bereinigte_query, original_inhalt)
         
     Raises:
         FileNotFoundError: Wenn Datei nicht existiert
-        IOError: Wenn Datei nicht lesbar ist
+        IOError: Wenn Datei nicht lesbar oder größer als MAX_QUERY_FILE_SIZE ist
         
     Beispiele:
     =========
@@ -66,17 +74,24 @@ def load_query_with_comments(filepath: str) -> Tuple[str, str]:
         file_path = Path(filepath)
         
         # Falls relativer Pfad, versuche relativ zu Projekt-Root
-        if not file_path.exists():
+        # (is_file() = ein stat()-Aufruf, schließt auch Verzeichnisse aus)
+        if not file_path.is_file():
             from pathlib import Path as PathlibPath
             PROJECT_ROOT = PathlibPath(__file__).parent.parent.parent
             file_path = PROJECT_ROOT / filepath
         
-        if not file_path.exists():
+        if not file_path.is_file():
             raise FileNotFoundError(f"Query-Datei nicht gefunden: {filepath}")
         
-        # Lese Original-Inhalt
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        # Größe prüfen, bevor irgendetwas gelesen wird
+        size = file_path.stat().st_size
+        if size > MAX_QUERY_FILE_SIZE:
+            raise IOError(
+                f"Query-Datei zu groß: {size} Bytes (Maximum: {MAX_QUERY_FILE_SIZE})"
+            )
+        
+        # Lese Original-Inhalt (ein Aufruf, die Größe ist bekannt)
+        original_content = file_path.read_text(encoding='utf-8')
         
         # Starte Parsing
         cleaned_lines = []
@@ -98,7 +113,7 @@ def load_query_with_comments(filepath: str) -> Tuple[str, str]:
         cleaned_query = ' '.join(cleaned_lines)
         
         # SCHRITT 5: Cleanup: Mehrfache Leerzeichen zu einzelnem Leerzeichen
-        cleaned_query = re.sub(r'\s+', ' ', cleaned_query).strip()
+        cleaned_query = _WHITESPACE_RE.sub(' ', cleaned_query).strip()
         
         return cleaned_query, original_content
         
@@ -151,11 +166,9 @@ def _remove_inline_comment(line: str) -> str:
     in_brackets = False
     bracket_depth = 0
     
-    result = []
-    i = 0
-    
-    while i < len(line):
-        char = line[i]
+    # Nur den Index weiterzählen und am Ende EINMAL schneiden
+    # (statt jedes Zeichen einzeln in eine Liste zu kopieren)
+    for i, char in enumerate(line):
         
         # VERWALTUNG VON QUOTING/BRACKETS
         # ================================
@@ -163,15 +176,11 @@ def _remove_inline_comment(line: str) -> str:
         # Single-Quote aktivieren/deaktivieren
         if char == "'" and not in_double_quote:
             in_single_quote = not in_single_quote
-            result.append(char)
-            i += 1
             continue
         
         # Double-Quote aktivieren/deaktivieren  
         if char == '"' and not in_single_quote:
             in_double_quote = not in_double_quote
-            result.append(char)
-            i += 1
             continue
         
         # Eckige Klammern zählen (nur außerhalb von Quotes)
@@ -191,13 +200,10 @@ def _remove_inline_comment(line: str) -> str:
             not in_single_quote and 
             not in_double_quote and 
             not in_brackets):
-            # Rest der Zeile ist Kommentar → Breche ab
-            break
-        
-        result.append(char)
-        i += 1
+            # Rest der Zeile ist Kommentar → abschneiden
+            return line[:i]
     
-    return ''.join(result)
+    return line
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -221,7 +227,7 @@ def _remove_inline_comment_regex(line: str) -> str:
     # Warnung: Das hier ist NICHT perfekt für komplexe Queries!
     # Besser: Character-basierte Version nutzen
     
-    match = re.search(r"(?<!['\"\\])#.*$", line)
+    match = _INLINE_COMMENT_RE.search(line)
     if match:
         return line[:match.start()]
     return line
@@ -417,7 +423,7 @@ if __name__ == "__main__":
             cleaned_lines.append(line_clean)
     
     result = ' '.join(cleaned_lines)
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = _WHITESPACE_RE.sub(' ', result).strip()
     
     print(f"Original:\n{example}\n")
     print(f"Bereinigt:\n{result}\n")
@@ -25,7 +25,7 @@ Wir suchen OHNE Filter und prüfen im Code, ob "Cochrane" im Journal/Title steht
 
 import requests
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import time
 import re
 
@@ -35,6 +35,10 @@ from src.config.settings import Settings
 # Der Logger wird vom LoggingManager zentralverwaltet und konfiguriert
 logger = logging.getLogger(__name__)
 
+# Vorkompilierte Ausdrücke für normalize_query()
+_FIELD_TAG_RE = re.compile(r'\[.*?\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class CochraneAdapter(DatabaseAdapter):
     """
@@ -52,17 +56,31 @@ class CochraneAdapter(DatabaseAdapter):
     filtern müssen.
     """
     
-    def __init__(self):
+    def __init__(self, session=None):
         """Initialisiert den Cochrane Adapter (via Europe PMC)"""
+        super().__init__(session)
+        
         # Wir nutzen die Europe PMC API Base URL
         self.base_url = getattr(Settings, 'EUROPEPMC_BASE_URL', 
                                "https://www.ebi.ac.uk/europepmc/webservices/rest/search")
         
-        logger.debug(f"CochraneAdapter initialisiert (via Europe PMC API / Soft-Filter)")
+        logger.debug("CochraneAdapter initialisiert (via Europe PMC API / Soft-Filter)")
     
     def search(self, query: str, limit: int = 25) -> List[Dict[str, Any]]:
         """
-        Sucht nach Cochrane Reviews.
+        Sucht nach Cochrane Reviews und gibt alle Treffer als Liste zurück.
+        
+        Sammelt nur die Artikel aus search_iter() ein.
+        """
+        return list(self.search_iter(query, limit=limit))
+    
+    def search_iter(self, query: str, limit: int = 25) -> Iterator[Dict[str, Any]]:
+        """
+        Sucht nach Cochrane Reviews und gibt jeden Treffer sofort weiter.
+        
+        Die Kandidaten werden beim Durchlaufen gefiltert - es wird keine
+        zweite (gefilterte) Liste aufgebaut, und nach 'limit' Treffern
+        ist Schluss.
         """
         # 1. Query anpassen: "AND Cochrane" (breiter Filter)
         normalized_query = self.normalize_query(query)
@@ -87,7 +105,7 @@ class CochraneAdapter(DatabaseAdapter):
             
             headers = {'User-Agent': 'ScientificResearchTool/1.0 (CochraneAdapter)'}
             
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
                 params=params,
                 headers=headers,
@@ -97,39 +115,41 @@ class CochraneAdapter(DatabaseAdapter):
             response.raise_for_status()
             data = response.json()
             
-            # Alle Kandidaten verarbeiten
-            candidates = self.process_results(data)
-            logger.info(f"Kandidaten gefunden: {len(candidates)}")
-            
-            # Client-Side Filtering: Ist es wirklich ein Cochrane Review?
-            # Wir prüfen Title, Journal oder DOI
-            filtered_results = []
-            for item in candidates:
-                # Prüfe Journal Name
-                journal = item.get('journal', '').lower()
-                title = item.get('title', '').lower()
-                doi = item.get('doi', '')
-                
-                is_cochrane = (
-                    'cochrane' in journal or 
-                    'systematic review' in title or 
-                    '10.1002/14651858' in doi  # Cochrane DOI Prefix
-                )
-                
-                if is_cochrane:
-                    filtered_results.append(item)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Fehler bei Cochrane-Suche (via Europe PMC): {e}")
+            return
+        
+        # Alle Kandidaten verarbeiten
+        candidates = self.process_results(data)
+        logger.info(f"Kandidaten gefunden: {len(candidates)}")
+        
+        # Client-Side Filtering: Ist es wirklich ein Cochrane Review?
+        # Wir prüfen Title, Journal oder DOI
+        found = 0
+        for item in candidates:
+            if found >= limit:
+                break
             
-            logger.info(f"Nach Filterung: {len(filtered_results)} echte Cochrane Reviews.")
+            # Prüfe Journal Name
+            journal = item.get('journal', '').lower()
+            title = item.get('title', '').lower()
+            doi = item.get('doi', '')
             
-            return filtered_results[:limit]
+            is_cochrane = (
+                'cochrane' in journal or 
+                'systematic review' in title or 
+                '10.1002/14651858' in doi  # Cochrane DOI Prefix
+            )
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Fehler bei Cochrane-Suche (via Europe PMC): {e}")
-            return []
+            if is_cochrane:
+                found += 1
+                yield item
+        
+        logger.info(f"Nach Filterung: {found} echte Cochrane Reviews.")
             
     def normalize_query(self, query: str) -> str:
-        cleaned = re.sub(r'\[.*?\]', '', query)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _FIELD_TAG_RE.sub('', query)
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
         return cleaned
     
     def process_results(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -23,7 +23,7 @@ import requests
 import logging
 import time
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
 from src.core.database_adapter import DatabaseAdapter
 from src.config.settings import Settings
@@ -31,6 +31,9 @@ from src.config.settings import Settings
 # Der Logger wird vom LoggingManager zentralverwaltet und konfiguriert
 logger = logging.getLogger(__name__)
 
+# Vorkompiliert für normalize_query()
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class EuropePMCAdapter(DatabaseAdapter):
     """
@@ -54,24 +57,43 @@ class EuropePMCAdapter(DatabaseAdapter):
     """
     
     def search(self, query: str, limit: int = 25) -> List[Dict[str, Any]]:
+        """
+        Führt eine Suche in Europe PMC aus und gibt alle Treffer als Liste zurück.
+        
+        Sammelt nur die Artikel aus search_iter() ein (dort passiert die
+        eigentliche Arbeit inkl. Pagination).
+        
+        Args:
+            query (str): Suchquery in Universe Format (mit AND/OR/NOT)
+            limit (int): Maximale Anzahl Artikel zu holen
+            
+        Returns:
+            List[Dict]: Strukturierte Artikel-Daten
+        """
+        return list(self.search_iter(query, limit=limit))
+    
+    def search_iter(self, query: str, limit: int = 25) -> Iterator[Dict[str, Any]]:
         """
         Führt eine Suche in Europe PMC aus und blättert durch die Ergebnisse.
         
+        Jede Seite wird weitergegeben, sobald sie geladen ist - der
+        Aufrufer kann sie exportieren, während die nächste Seite noch
+        gar nicht angefragt wurde.
+        
         WORKFLOW:
         =========
         1. Normalisiere die Query (minimal - nur Whitespace)
         2. Setze Standard URL (falls nicht in Settings definiert)
         3. Setze HTTP-Header (User-Agent ist wichtig für API)
         4. Starte Pagination mit cursorMark='*'
-        5. Sammle Ergebnisse bis zum Limit
-        6. Gebe strukturierte Ergebnisse zurück
+        5. Gebe jede Seite sofort weiter, bis das Limit erreicht ist
         
         Args:
             query (str): Suchquery in Universe Format (mit AND/OR/NOT)
             limit (int): Maximale Anzahl Artikel zu holen
             
-        Returns:
-            List[Dict]: Strukturierte Artikel-Daten
+        Yields:
+            Dict: Strukturierte Artikel-Daten (ein Artikel pro Schritt)
         """
         
         # Standard URL falls nicht in Settings definiert
@@ -96,14 +118,14 @@ class EuropePMCAdapter(DatabaseAdapter):
         logger.info(f"Normalized Query: '{normalized_query}'")
         logger.info(f"Starte Suche in Europe PMC nach: '{normalized_query[:50]}...' (Ziel: {limit} Artikel)")
         
-        all_results = []
+        total = 0
         next_cursor = '*'
         page_count = 0
         
         try:
-            while len(all_results) < limit:
+            while total < limit:
                 page_count += 1
-                remaining = limit - len(all_results)
+                remaining = limit - total
                 
                 # Europe PMC erlaubt max 1000 pro Seite
                 page_size = min(remaining, 1000)
@@ -119,9 +141,9 @@ class EuropePMCAdapter(DatabaseAdapter):
                     'cursorMark': next_cursor
                 }
                 
-                logger.debug(f"Request Parameter: {params}")
+                logger.debug("Request Parameter: %s", params)
                 
-                response = requests.get(
+                response = self.session.get(
                     base_url,
                     params=params,
                     headers=headers,
@@ -131,15 +153,18 @@ class EuropePMCAdapter(DatabaseAdapter):
                 response.raise_for_status()
                 data = response.json()
                 
-                # Ergebnisse verarbeiten
-                new_results = self.process_results(data)
+                # Ergebnisse verarbeiten (nie mehr als das Limit)
+                new_results = self.process_results(data)[:remaining]
                 
                 if not new_results:
                     logger.info("Keine weiteren Ergebnisse verfügbar.")
                     break
                 
-                all_results.extend(new_results)
-                logger.info(f"Seite {page_count}: {len(new_results)} geladen. Gesamt: {len(all_results)}/{limit}")
+                total += len(new_results)
+                logger.info(f"Seite {page_count}: {len(new_results)} geladen. Gesamt: {total}/{limit}")
+                
+                # Seite sofort weitergeben
+                yield from new_results
                 
                 # Nächster Cursor
                 cursor_from_api = data.get('nextCursorMark')
@@ -152,21 +177,17 @@ class EuropePMCAdapter(DatabaseAdapter):
                 next_cursor = cursor_from_api
                 
                 # Rate Limit einhalten
-                if len(all_results) < limit:
+                if total < limit:
                     time.sleep(getattr(Settings, 'RATE_LIMIT_DELAY', 0.5))
         
         except requests.exceptions.RequestException as e:
             logger.error(f"Netzwerkfehler bei Europe PMC Anfrage: {e}")
-            # Gib zurück was wir haben, auch wenn Fehler auftrat
-            if all_results:
-                logger.warning(f"Gebe {len(all_results)} bereits gefundene Ergebnisse zurück trotz Fehler.")
-                return all_results
-            return []
-        
-        final_results = all_results[:limit]
-        logger.info(f"Suche beendet. {len(final_results)} Artikel zurückgegeben.")
+            # Was schon weitergegeben wurde, bleibt gültig
+            if total:
+                logger.warning(f"{total} bereits gefundene Ergebnisse wurden trotz Fehler zurückgegeben.")
+            return
         
-        return final_results
+        logger.info(f"Suche beendet. {total} Artikel zurückgegeben.")
     
     def normalize_query(self, query: str) -> str:
         """
@@ -197,7 +218,7 @@ class EuropePMCAdapter(DatabaseAdapter):
         """
         
         # 1. Newlines und Tabs zu Spaces
-        normalized = re.sub(r'\s+', ' ', query)
+        normalized = _WHITESPACE_RE.sub(' ', query)
         
         # 2. Trimmen
         normalized = normalized.strip()
@@ -17,33 +17,66 @@ ESearch *braucht* die Field-Tags.
 
 import requests
 import logging
-from typing import List, Dict, Any
-import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional
 import os
 import re
 
-from src.core.database_adapter import DatabaseAdapter
+from src.core.database_adapter import DatabaseAdapter, RateLimiter, create_http_session
 from src.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# So viele IDs holt ein ESummary-Request auf einmal. Größere Ergebnismengen
+# werden in Paketen geladen und Paket für Paket weitergegeben (eine
+# einzige GET-URL mit tausenden IDs wäre ohnehin zu lang).
+ESUMMARY_BATCH_SIZE = 200
+
+# NCBI erlaubt 3 Requests/s ohne und 10 Requests/s mit API-Key.
+# Das ist zugleich das Limit des RateLimiters (für ALLE E-Utilities-
+# Anfragen inkl. ESearch und Wiederholungen) und die Anzahl der
+# ESummary-Pakete, die höchstens gleichzeitig laufen.
+MAX_PARALLEL_REQUESTS = 3
+MAX_PARALLEL_REQUESTS_WITH_KEY = 10
+
 class PubMedAdapter(DatabaseAdapter):
     """
     Adapter für PubMed API (E-Utilities).
     """
 
-    def __init__(self):
+    def __init__(self, session=None):
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
         self.api_key = getattr(Settings, 'PUBMED_API_KEY', None)
         self.email = getattr(Settings, 'PUBMED_EMAIL', None)
-        logger.debug(f"PubMedAdapter initialisiert (Email: {self.email})")
+        
+        # Ein gemeinsamer RateLimiter für alle Anfragen dieses Adapters
+        # (ESearch, alle ESummary-Threads und deren Wiederholungen)
+        self.rate_limiter = RateLimiter(
+            MAX_PARALLEL_REQUESTS_WITH_KEY if self.api_key else MAX_PARALLEL_REQUESTS
+        )
+        super().__init__(session if session is not None else create_http_session(self.rate_limiter))
+        logger.debug("PubMedAdapter initialisiert (Email: %s)", self.email)
 
     def search(self, query: str, limit: int = 25) -> List[Dict[str, Any]]:
         """
-        Sucht in PubMed.
+        Sucht in PubMed und gibt alle Treffer als Liste zurück.
+        
+        Sammelt nur die Artikel aus search_iter() ein.
+        """
+        return list(self.search_iter(query, limit=limit))
+
+    def search_iter(self, query: str, limit: int = 25) -> Iterator[Dict[str, Any]]:
+        """
+        Sucht in PubMed und gibt die Artikel paketweise weiter.
         
         WICHTIG: Die Query wird 1:1 an ESearch weitergegeben.
         Keine Normalisierung (Entfernen von [Tags]), da ESearch diese benötigt!
+        
+        Die Details werden in Paketen zu ESUMMARY_BATCH_SIZE IDs geholt.
+        Mehrere Pakete laufen parallel (siehe _iter_summaries()), die
+        Artikel kommen trotzdem in der Reihenfolge von ESearch heraus.
         """
         logger.info(f"Original Query: '{query}'")
         
@@ -51,19 +84,71 @@ class PubMedAdapter(DatabaseAdapter):
         # Hier nutzen wir die Query exakt so wie sie ist!
         esearch_query = query 
         
-        logger.debug(f"PubMed ESearch Query: {esearch_query}")
+        logger.debug("PubMed ESearch Query: %s", esearch_query)
         
         id_list = self._esearch(esearch_query, limit)
         
         if not id_list:
             logger.warning("Keine Ergebnisse gefunden.")
-            return []
+            return
             
         logger.info(f"ESearch gefunden: {len(id_list)} Artikel")
         
-        # 2. EFetch: Details holen
-        articles = self._efetch(id_list)
-        return articles
+        # 2. EFetch: Details paketweise holen
+        yield from self._iter_summaries(id_list)
+
+    def _iter_summaries(self, id_list: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Holt die Details für alle IDs in parallelen ESummary-Paketen.
+        
+        Früher wurde Paket für Paket geladen: Anfrage, warten, nächste
+        Anfrage. Bei limit=1000 waren das 5 Round-Trips hintereinander.
+        Jetzt laufen bis zu N Pakete gleichzeitig (N = 3 ohne, 10 mit
+        API-Key). Jede Anfrage - auch ESearch davor und automatische
+        Wiederholungen - wartet auf self.rate_limiter, so bleiben wir
+        unter dem NCBI-Limit, warten aber nicht mehr auf jede Antwort.
+        
+        Jeder Thread bekommt eine eigene Session (eine requests.Session
+        darf nicht von mehreren Threads gleichzeitig benutzt werden).
+        
+        Fertige Pakete werden sofort weitergegeben, sobald alle Pakete
+        davor ebenfalls fertig sind - die Reihenfolge bleibt erhalten.
+        
+        Argumente:
+            id_list (list): PubMed-IDs aus ESearch
+        
+        Yields:
+            dict: Ein Artikel nach dem anderen
+        """
+        batches = [
+            id_list[start:start + ESUMMARY_BATCH_SIZE]
+            for start in range(0, len(id_list), ESUMMARY_BATCH_SIZE)
+        ]
+        if len(batches) == 1:
+            yield from self._efetch(batches[0])
+            return
+        
+        max_parallel = MAX_PARALLEL_REQUESTS_WITH_KEY if self.api_key else MAX_PARALLEL_REQUESTS
+        
+        # Eine Session pro Worker-Thread, am Ende alle schließen
+        local = threading.local()
+        sessions = []
+        
+        def fetch(batch: List[str]) -> List[Dict[str, Any]]:
+            session = getattr(local, 'session', None)
+            if session is None:
+                session = local.session = create_http_session(self.rate_limiter)
+                sessions.append(session)
+            return self._efetch(batch, session)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                pending = deque(executor.submit(fetch, batch) for batch in batches)
+                while pending:
+                    yield from pending.popleft().result()
+        finally:
+            for session in sessions:
+                session.close()
 
     def _esearch(self, query: str, limit: int) -> List[str]:
         """Führt ESearch aus und gibt Liste von IDs zurück."""
@@ -79,8 +164,9 @@ class PubMedAdapter(DatabaseAdapter):
         if self.api_key: params['api_key'] = self.api_key
 
         try:
-            logger.debug(f"ESearch Params: {params}")
-            response = requests.get(url, params=params, timeout=30)
+            logger.debug("ESearch Params: %s", params)
+            self.rate_limiter.wait()
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -94,10 +180,17 @@ class PubMedAdapter(DatabaseAdapter):
             logger.error(f"Fehler bei ESearch: {e}")
             return []
 
-    def _efetch(self, id_list: List[str]) -> List[Dict[str, Any]]:
-        """Führt EFetch für eine Liste von IDs aus."""
+    def _efetch(self, id_list: List[str], session: Optional[requests.Session] = None) -> List[Dict[str, Any]]:
+        """
+        Führt EFetch für eine Liste von IDs aus.
+        
+        session: Session für die Anfrage (Standard: self.session). Worker-
+        Threads übergeben hier ihre eigene Session.
+        """
         if not id_list:
             return []
+        if session is None:
+            session = self.session
             
         url = f"{self.base_url}/efetch.fcgi"
         ids_str = ",".join(id_list)
@@ -127,7 +220,8 @@ class PubMedAdapter(DatabaseAdapter):
             summary_url = f"{self.base_url}/esummary.fcgi"
             params['retmode'] = 'json'
             
-            response = requests.get(summary_url, params=params, timeout=30)
+            self.rate_limiter.wait()
+            response = session.get(summary_url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
             
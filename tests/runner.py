@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# ============================================================================
+# FILE: runner.py
+# DIRECTORY: tests/
+# FULL PATH: tests/runner.py
+#
+# DESCRIPTION: Shared script runner for the test files in tests/
+# PURPOSE: Lets every test file run without pytest
+#          (python tests/test_<name>.py) while its test_* functions stay
+#          plain functions that pytest collects as well
+#
+# USAGE (at the end of a test file):
+#   if __name__ == '__main__':
+#       exit(run_tests(globals()))
+#
+# ============================================================================
+
+
+def run_tests(namespace):
+    """
+    Run all test_* functions in namespace (a module's globals()) in name
+    order and print a summary. Returns the exit code: 0 if all passed.
+    """
+    tests = [obj for name, obj in sorted(namespace.items())
+             if name.startswith('test_') and callable(obj)]
+    passed = failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+        else:
+            passed += 1
+            print(f"  ✅ {test.__name__}")
+
+    print("\n" + "=" * 70)
+    print(f"TEST RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+    return 0 if failed == 0 else 1
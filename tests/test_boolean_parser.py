@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# ============================================================================
+# FILE: test_boolean_parser.py
+# DIRECTORY: tests/
+# FULL PATH: tests/test_boolean_parser.py
+#
+# DESCRIPTION: Regression tests for the boolean parser modules
+#              (src/core/boolean_parser.py and the versioned root copies)
+# PURPOSE: Pin down behavior that the performance rewrites must keep:
+#          validation time on pathological input, cached batch parsing,
+#          and how the command line tells query files from query strings
+#
+# USAGE:
+#   python tests/test_boolean_parser.py
+#   python -m pytest tests/test_boolean_parser.py
+#
+# ============================================================================
+
+import sys
+import os
+import io
+import time
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add the repository root to the path so we can import the parser modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.runner import run_tests
+import boolean_parser_v1_1_0
+import boolean_parser_v1_2_1
+from src.core import boolean_parser
+from src.core.boolean_parser import parse_query, parse_queries, is_query_file, get_query_info
+
+
+# ============================================================================
+# VALIDATION PERFORMANCE
+# ============================================================================
+
+def test_v110_validator_does_not_backtrack_on_space_runs():
+    """
+    A quoted term, a long run of spaces and then an unclosed quote used to
+    make _VALID_QUERY_RE backtrack exponentially (5.9 s at 24 spaces).
+    """
+    for spaces in (24, 1000):
+        query = '"a"' + ' ' * spaces + '"bad'
+        start = time.perf_counter()
+        assert boolean_parser_v1_1_0.validate_single_line(query) is False
+        assert time.perf_counter() - start < 0.5, f"{spaces} spaces took too long"
+
+
+def test_v110_validator_still_accepts_spaced_queries():
+    """Runs of spaces and parentheses between valid tokens stay valid."""
+    assert boolean_parser_v1_1_0.validate_single_line('("a"[TIAB]    OR   "b c")  AND  d')
+
+
+def test_clear_caches_empties_every_result_cache():
+    """clear_caches() resets all lru_caches of the versioned parsers."""
+    query = '"cancer"[MeSH] AND treatment'
+    boolean_parser_v1_1_0.parse_query(query)
+    boolean_parser_v1_2_1.parse_query(query)
+    boolean_parser_v1_2_1.tokenize(query)
+    boolean_parser_v1_2_1.validate_single_line(query)
+    boolean_parser_v1_2_1.validate_multiline(query)
+
+    boolean_parser_v1_1_0.clear_caches()
+    boolean_parser_v1_2_1.clear_caches()
+
+    assert boolean_parser_v1_1_0._parse_query_cached.cache_info().currsize == 0
+    for cached in (boolean_parser_v1_2_1._parse_query_cached,
+                   boolean_parser_v1_2_1._tokenize_cached,
+                   boolean_parser_v1_2_1.validate_single_line,
+                   boolean_parser_v1_2_1.validate_multiline):
+        assert cached.cache_info().currsize == 0, cached.__name__
+
+
+# ============================================================================
+# CACHED AND BATCH PARSING (parse_query / parse_queries)
+# ============================================================================
+
+BATCH_QUERIES = [
+    '"cancer"[MeSH] AND treatment',
+    '(tumor OR cancer) AND NOT mouse',
+    '"cancer"[MeSH] AND treatment',          # repeated query
+    '  spaced   query  ',
+    '',
+    '   ',
+    '(cancer\nAND\ntreatment)',               # multi-line
+    'cancer AND',                             # invalid
+    '"unclosed AND x',
+    "'tumor'[TIAB] or \"a b\"",
+    'a (b) c',
+]
+
+
+def test_parse_query_result_is_independent_of_cache():
+    """Changing a returned result must not change later results."""
+    query = '"cancer"[MeSH] AND treatment'
+    first = parse_query(query)
+    expected = {key: (list(value) if key == 'tokens' else value) for key, value in first.items()}
+
+    first['tokens'].append('MUTATED')
+    first['success'] = 'MUTATED'
+    first['error'] = 'MUTATED'
+
+    assert parse_query(query) == expected
+    assert parse_query(query)['tokens'] is not parse_query(query)['tokens']
+
+
+def test_parse_queries_matches_parse_query():
+    """The batch API gives the same result as one parse_query() per query."""
+    assert parse_queries(BATCH_QUERIES) == [parse_query(q) for q in BATCH_QUERIES]
+    assert parse_queries([]) == []
+
+
+def test_parse_queries_results_are_independent():
+    """Results for repeated queries don't share lists with each other or the cache."""
+    results = parse_queries(BATCH_QUERIES)
+    results[0]['tokens'].append('MUTATED')
+    results[6]['tokens'].append('MUTATED')
+
+    assert 'MUTATED' not in results[2]['tokens']
+    assert 'MUTATED' not in parse_query(BATCH_QUERIES[0])['tokens']
+    assert 'MUTATED' not in parse_query(BATCH_QUERIES[6])['tokens']
+    assert parse_queries(BATCH_QUERIES) == [parse_query(q) for q in BATCH_QUERIES]
+
+
+def test_get_query_info_takes_a_query_string():
+    """The documented call get_query_info(query) tokenizes the string itself."""
+    info = get_query_info('"cancer"[MeSH] AND "treatment"[TIAB] OR (tumor)')
+    assert info['field_terms'] == ['"cancer"[MeSH]', '"treatment"[TIAB]']
+    assert info['num_field_terms'] == 2
+    assert info['operators'] == ['AND', 'OR']
+    assert info['operands'] == ['tumor']
+    assert info['num_tokens'] == 7
+
+
+def test_format_layperson_log_returns_written_report():
+    """format_layperson_log() returns what write_layperson_log() writes."""
+    queries_data = [
+        {'line': 1, 'query': '"cancer"[MeSH] AND treatment',
+         'result': parse_query('"cancer"[MeSH] AND treatment'),
+         'info': get_query_info('"cancer"[MeSH] AND treatment')},
+        {'line': 2, 'query': 'cancer AND', 'result': parse_query('cancer AND'), 'info': {}},
+    ]
+    now = boolean_parser.datetime(2024, 1, 2, 3, 4, 5)
+    out = io.StringIO()
+    boolean_parser.write_layperson_log(queries_data, out, now=now)
+
+    text = boolean_parser.format_layperson_log(queries_data, now=now)
+    assert isinstance(text, str)
+    assert text + '\n' == out.getvalue()
+    assert 'Generated: 2024-01-02 03:04:05' in text
+    assert '"cancer"[MeSH]' in text
+
+
+# ============================================================================
+# COMMAND LINE: QUERY FILE OR QUERY STRING
+# ============================================================================
+
+def test_existing_file_is_a_query_file_whatever_its_name():
+    """File names with quotes or " AND " must still be read as files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ('cancer AND tumor.txt', 'my "best" queries.txt', 'a OR b'):
+            path = Path(tmp) / name
+            path.write_text('cancer AND treatment\n', encoding='utf-8')
+            assert is_query_file(str(path)), name
+
+
+def test_query_strings_are_not_files():
+    assert not is_query_file('"cancer"[MeSH] AND treatment')
+    # Longer than a file name may be: the OSError means "not a file"
+    assert not is_query_file('cancer AND ' * 40)
+
+
+def test_main_reads_file_named_like_a_query():
+    """main() runs every query in the file, not the file name as one query."""
+    with tempfile.TemporaryDirectory() as tmp:
+        query_file = Path(tmp) / '"cancer" AND tumor.txt'
+        query_file.write_text('cancer AND treatment\n(tumor OR mass)\n', encoding='utf-8')
+
+        create_log_filename = boolean_parser.create_log_filename
+        argv = sys.argv
+        boolean_parser.create_log_filename = (
+            lambda now=None: create_log_filename(log_dir=tmp, now=now))
+        sys.argv = ['boolean_parser.py', str(query_file)]
+        output = io.StringIO()
+        try:
+            with redirect_stdout(output):
+                boolean_parser.main()
+        finally:
+            boolean_parser.create_log_filename = create_log_filename
+            sys.argv = argv
+
+    text = output.getvalue()
+    assert '[1] cancer AND treatment' in text
+    assert '[2] (tumor OR mass)' in text
+
+
+# ============================================================================
+# MAIN TEST EXECUTION
+# ============================================================================
+
+if __name__ == '__main__':
+    exit(run_tests(globals()))
@@ -352,6 +352,7 @@ def test_group_1_field_term_recognition(results, logger):
         ('"2020-2025"[pdat]', True, "Numbers in quotes with date field code"),
         ('"(cancer OR tumor)"[TIAB]', True, "Complex content in quotes with field code"),
         ('"Smith J"[AU]', True, "Author name with AU field code"),
+        ('"cancer"[MeSH]\n', True, "One trailing line break is accepted (like re.match with $)"),
     ]
     
     for token, expected, name in tests:
@@ -369,6 +370,7 @@ def test_group_1_field_term_recognition(results, logger):
         ('cancer', False, "Simple term without quotes or brackets"),
         ('[MeSH]', False, "Just brackets without quoted term"),
         ('"cancer"[MeSH]extra', False, "Extra characters after bracket"),
+        ('"cancer"[MeSH]\n\n', False, "More than one trailing line break"),
     ]
     
     for token, expected, name in tests:
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# ============================================================================
+# FILE: test_main_export.py
+# DIRECTORY: tests/
+# FULL PATH: tests/test_main_export.py
+#
+# DESCRIPTION: Round-trip tests for export_results() in main.py
+# PURPOSE: Write every export format (CSV, JSON, JSON Lines), plain and
+#          compressed (.gz, .zst), read it back and compare. Also pin that
+#          the stdlib JSON fallback writes the same bytes as orjson
+#          (non-ASCII stays unescaped, as with ensure_ascii=False)
+#
+# USAGE:
+#   python tests/test_main_export.py
+#   python -m pytest tests/test_main_export.py
+#
+# ============================================================================
+
+import sys
+import os
+import io
+import csv
+import gzip
+import json
+import importlib.util
+import tempfile
+from pathlib import Path
+
+# Add the repository root to the path so we can import main.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.runner import run_tests
+import main
+
+MAIN_PY = Path(__file__).resolve().parent.parent / "main.py"
+
+
+def load_main_without_orjson():
+    """Import a second copy of main.py that cannot see orjson."""
+    saved = sys.modules.get("orjson")
+    sys.modules["orjson"] = None  # makes "import orjson" raise ImportError
+    try:
+        spec = importlib.util.spec_from_file_location("main_without_orjson", MAIN_PY)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            del sys.modules["orjson"]
+        else:
+            sys.modules["orjson"] = saved
+    return module
+
+
+def sample_articles(count=3):
+    """Articles with umlauts, CJK, emoji, quotes, newlines and a missing field."""
+    articles = []
+    for number in range(count):
+        articles.append({
+            "id": str(number),
+            "source": "pubmed",
+            "title": f'Wirksamkeit von Übungen "{number}" – 研究 🧪',
+            "year": "2024",
+            "authors": "Müller A, Øster B",
+            "journal": "Ärzteblatt",
+            "doi": f"10.1000/ä{number}",
+            "url": f"https://pubmed.ncbi.nlm.nih.gov/{number}/",
+            "abstract": "Zeile 1\nZeile 2\t(Tab)",
+        })
+    del articles[-1]["abstract"]
+    return articles
+
+
+def read_text(path):
+    """Read an export back as text, decompressing by suffix."""
+    raw = path.read_bytes()
+    if path.suffix == ".gz":
+        raw = gzip.decompress(raw)
+    elif path.suffix == ".zst":
+        import zstandard
+        raw = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(raw)).read()
+    return raw.decode("utf-8")
+
+
+def compressions():
+    """Compression suffixes available here ('' = uncompressed)."""
+    return ["", ".gz"] + ([".zst"] if main.zstandard is not None else [])
+
+
+# ============================================================================
+# ROUND TRIPS
+# ============================================================================
+
+def test_json_round_trip():
+    """Small exports are indented exactly like json.dump(indent=2)."""
+    articles = sample_articles()
+    with tempfile.TemporaryDirectory() as tmp:
+        for compression in compressions():
+            path = Path(tmp) / f"results.json{compression}"
+            main.export_results(iter(articles), path)
+            text = read_text(path)
+            assert json.loads(text) == articles, compression
+            assert text == json.dumps(articles, indent=2, ensure_ascii=False), compression
+
+
+def test_large_json_round_trip_is_compact():
+    articles = sample_articles(main._COMPACT_JSON_MIN_RESULTS + 5)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "results.json.gz"
+        main.export_results(iter(articles), path)
+        text = read_text(path)
+        assert json.loads(text) == articles
+        assert text == json.dumps(articles, separators=(",", ":"), ensure_ascii=False)
+
+
+def test_jsonl_round_trip():
+    articles = sample_articles()
+    with tempfile.TemporaryDirectory() as tmp:
+        for compression in compressions():
+            path = Path(tmp) / f"results.jsonl{compression}"
+            main.export_results(iter(articles), path)
+            lines = read_text(path).splitlines()
+            assert [json.loads(line) for line in lines] == articles, compression
+
+
+def test_csv_round_trip():
+    """Missing fields become empty cells, extra fields are dropped."""
+    articles = sample_articles()
+    articles[0]["extra"] = "not exported"
+    with tempfile.TemporaryDirectory() as tmp:
+        for compression in compressions():
+            path = Path(tmp) / f"results.csv{compression}"
+            main.export_results(iter(articles), path)
+            rows = list(csv.DictReader(io.StringIO(read_text(path), newline="")))
+            expected = [{name: a.get(name, "") for name in main._FIELDNAMES} for a in articles]
+            assert rows == expected, compression
+
+
+def test_no_file_without_results():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "results.jsonl.gz"
+        main.export_results(iter([]), path)
+        assert not path.exists()
+
+
+# ============================================================================
+# ORJSON / STDLIB PARITY
+# ============================================================================
+
+def test_stdlib_fallback_matches_orjson_bytes():
+    """Both JSON paths write unescaped UTF-8 and identical files."""
+    fallback = load_main_without_orjson()
+    assert fallback.orjson is None
+
+    articles = sample_articles()
+    for name in ("_json_compact", "_json_indented"):
+        fallback_bytes = b"".join(getattr(fallback, name)(a) for a in articles)
+        assert "Übungen".encode("utf-8") in fallback_bytes
+        assert b"\\u00dc" not in fallback_bytes
+        if main.orjson is not None:
+            main_bytes = b"".join(getattr(main, name)(a) for a in articles)
+            assert fallback_bytes == main_bytes, name
+
+
+# ============================================================================
+# MAIN TEST EXECUTION
+# ============================================================================
+
+if __name__ == '__main__':
+    exit(run_tests(globals()))
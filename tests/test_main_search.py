@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# ============================================================================
+# FILE: test_main_search.py
+# DIRECTORY: tests/
+# FULL PATH: tests/test_main_search.py
+#
+# DESCRIPTION: Tests for the search pipeline in main.py
+# PURPOSE: Verify duplicate detection (_dedup_key), source parsing and the
+#          streaming search() generator (single and parallel multi-source)
+#          with stub adapters instead of network access
+#
+# USAGE:
+#   python tests/test_main_search.py
+#   python -m pytest tests/test_main_search.py
+#
+# ============================================================================
+
+import sys
+import os
+import argparse
+import threading
+import time
+from contextlib import contextmanager
+
+# Add the repository root to the path so we can import main.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.runner import run_tests
+import main
+
+
+# ============================================================================
+# DUPLICATE KEYS
+# ============================================================================
+
+def test_dedup_key_prefers_doi_across_sources():
+    """The same DOI is one article, whichever database returned it."""
+    a = {"id": "1", "source": "pubmed", "doi": "10.1000/ABC"}
+    b = {"id": "PMC9", "source": "PMC", "doi": "10.1000/abc"}
+    assert main._dedup_key(a) == main._dedup_key(b)
+
+
+def test_dedup_key_tags_ids_with_source():
+    """Equal IDs from different databases are different articles."""
+    a = {"id": "12345", "source": "pubmed", "doi": "N/A"}
+    b = {"id": "12345", "source": "cochrane", "doi": "N/A"}
+    assert main._dedup_key(a) != main._dedup_key(b)
+    assert main._dedup_key(a) == main._dedup_key(dict(a, title="other"))
+
+
+def test_dedup_key_title_needs_year_and_journal():
+    """Articles without ID only match on title, year and journal together."""
+    erratum = {"title": "Erratum", "year": "2020", "journal": "J A"}
+    assert main._dedup_key(erratum) != main._dedup_key(dict(erratum, journal="J B"))
+    assert main._dedup_key(erratum) != main._dedup_key(dict(erratum, year="2021"))
+    assert main._dedup_key(erratum) == main._dedup_key(dict(erratum, title="ERRATUM"))
+
+
+def test_dedup_key_without_values_is_none():
+    """Articles with no DOI, ID or title are never filtered."""
+    assert main._dedup_key({"doi": "N/A", "id": "N/A"}) is None
+
+
+# ============================================================================
+# STUB ADAPTERS
+# ============================================================================
+
+@contextmanager
+def patched(obj, name, value):
+    """Temporarily replace obj.name (works without pytest's monkeypatch)."""
+    original = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        setattr(obj, name, original)
+
+
+def make_adapters(articles_by_source, calls=None, before_return=None):
+    """
+    Build a _get_adapter() replacement that serves fixed articles.
+
+    articles_by_source: {source: list of article dicts or an Exception}
+    calls:              optional list; (source, limit) is appended per search
+    before_return:      optional {source: callable} run before returning
+    """
+    def get_adapter(source):
+        class StubAdapter:
+            def search(self, query, limit=25):
+                if calls is not None:
+                    calls.append((source, limit))
+                if before_return and source in before_return:
+                    before_return[source]()
+                articles = articles_by_source[source]
+                if isinstance(articles, Exception):
+                    raise articles
+                return articles[:limit]
+
+            def search_iter(self, query, limit=25):
+                yield from self.search(query, limit=limit)
+        return StubAdapter
+    return get_adapter
+
+
+def article(source, number, doi="N/A"):
+    return {"id": str(number), "source": source, "title": f"{source} {number}", "doi": doi}
+
+
+# ============================================================================
+# SOURCE PARSING
+# ============================================================================
+
+def test_parse_sources_normalizes_list():
+    """Case, spaces and repeated names are cleaned up, order is kept."""
+    assert main._parse_sources("PubMed, europepmc,pubmed") == "pubmed,europepmc"
+
+
+def test_parse_sources_rejects_unknown_and_empty():
+    for value in ("foo", "pubmed,foo", "", " , "):
+        try:
+            main._parse_sources(value)
+        except argparse.ArgumentTypeError:
+            continue
+        raise AssertionError(f"{value!r} was accepted")
+
+
+def test_search_rejects_unknown_source():
+    """search() raises ValueError (not assert, which python -O removes)."""
+    try:
+        list(main.search("cancer AND therapy", "pubmed,foo", 5))
+    except ValueError as e:
+        assert "foo" in str(e)
+    else:
+        raise AssertionError("unknown source was accepted")
+
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+def test_single_source_streams_adapter_results():
+    articles = [article("pubmed", n) for n in range(3)]
+    with patched(main, "_get_adapter", make_adapters({"pubmed": articles})):
+        assert list(main.search("cancer AND therapy", "pubmed", 10)) == articles
+
+
+def test_parallel_search_merges_sources_in_completion_order():
+    """Each database's articles stay together, the first to finish comes first."""
+    europepmc_done = threading.Event()
+
+    def wait_for_europepmc():
+        europepmc_done.wait(5)
+        time.sleep(0.1)
+
+    stubs = make_adapters(
+        {"pubmed": [article("pubmed", n) for n in range(3)],
+         "europepmc": [article("MED", n) for n in range(10, 13)]},
+        before_return={"pubmed": wait_for_europepmc, "europepmc": europepmc_done.set},
+    )
+    with patched(main, "_get_adapter", stubs):
+        results = list(main.search("cancer AND therapy", "pubmed,europepmc", 10))
+
+    assert [(a["source"], a["id"]) for a in results] == [
+        ("MED", "10"), ("MED", "11"), ("MED", "12"),
+        ("pubmed", "0"), ("pubmed", "1"), ("pubmed", "2"),
+    ]
+
+
+def test_parallel_search_deduplicates_across_sources():
+    """Same DOI in two databases is kept once; equal IDs alone are not duplicates."""
+    stubs = make_adapters({
+        "pubmed": [article("pubmed", 1, doi="10.1/shared"), article("pubmed", 2)],
+        "cochrane": [article("cochrane", 7, doi="10.1/SHARED"), article("cochrane", 2)],
+    })
+    with patched(main, "_get_adapter", stubs):
+        results = list(main.search("cancer AND therapy", "pubmed,cochrane", 10))
+
+    dois = [a["doi"].lower() for a in results if a["doi"] != "N/A"]
+    assert dois == ["10.1/shared"]
+    assert sorted((a["source"], a["id"]) for a in results if a["doi"] == "N/A") == [
+        ("cochrane", "2"), ("pubmed", "2"),
+    ]
+
+
+def test_parallel_search_applies_limit_per_database():
+    calls = []
+    stubs = make_adapters(
+        {name: [article(name, n) for n in range(10)] for name in ("pubmed", "europepmc", "cochrane")},
+        calls=calls,
+    )
+    with patched(main, "_get_adapter", stubs):
+        results = list(main.search("cancer AND therapy", "pubmed,europepmc,cochrane", 4))
+
+    assert sorted(calls) == [("cochrane", 4), ("europepmc", 4), ("pubmed", 4)]
+    assert len(results) == 12
+
+
+def test_parallel_search_keeps_other_sources_on_error():
+    stubs = make_adapters({
+        "pubmed": RuntimeError("down"),
+        "europepmc": [article("MED", 1)],
+    })
+    with patched(main, "_get_adapter", stubs):
+        results = list(main.search("cancer AND therapy", "pubmed,europepmc", 10))
+    assert results == [article("MED", 1)]
+
+
+def test_main_names_log_after_all_sources():
+    """--source a,b logs into one file named a+b."""
+    created = []
+
+    class StubLoggingManager:
+        def __init__(self, database):
+            created.append(database)
+
+        def set_verbose(self, verbose=True):
+            pass
+
+    argv = ["main.py", "--query", "cancer AND therapy", "--source", "europepmc,pubmed", "--limit", "2"]
+    stubs = make_adapters({"pubmed": [article("pubmed", 1)], "europepmc": [article("MED", 1)]})
+    with patched(main, "_get_adapter", stubs), \
+            patched(main, "LoggingManager", StubLoggingManager), \
+            patched(sys, "argv", argv):
+        main.main()
+
+    assert created == ["europepmc+pubmed"]
+
+
+# ============================================================================
+# MAIN TEST EXECUTION
+# ============================================================================
+
+if __name__ == '__main__':
+    exit(run_tests(globals()))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# ============================================================================
+# FILE: test_main_validation.py
+# DIRECTORY: tests/
+# FULL PATH: tests/test_main_validation.py
+#
+# DESCRIPTION: Tests for validate_query_syntax() in main.py
+# PURPOSE: Verify the parenthesis checks (count and order) for queries in
+#          any script, before a query is sent to a database
+#
+# USAGE:
+#   python tests/test_main_validation.py
+#   python -m pytest tests/test_main_validation.py
+#
+# ============================================================================
+
+import sys
+import os
+
+# Add the repository root to the path so we can import main.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.runner import run_tests
+import main
+
+
+# ============================================================================
+# PARENTHESES
+# ============================================================================
+
+def test_balanced_queries_pass():
+    for query in ("cancer AND tumor",
+                  "(cancer OR tumor) AND (2020:2025)",
+                  "((cancer OR tumor) AND (2020:2025)) NOT mouse"):
+        assert main.validate_query_syntax(query), query
+
+
+def test_unbalanced_parentheses_fail():
+    for query in ("(cancer OR tumor AND (2020:2025)", "cancer) AND (tumor))"):
+        assert not main.validate_query_syntax(query), query
+
+
+def test_closing_before_opening_fails():
+    """Equal counts are not enough: ")a(" closes before it opens."""
+    for query in (")a(", "(cancer)) AND ((tumor)", ") cancer AND tumor ("):
+        assert not main.validate_query_syntax(query), query
+
+
+def test_parenthesis_order_in_non_latin_queries():
+    """The order check also covers characters outside Latin-1."""
+    assert main.validate_query_syntax("(癌症 OR 肿瘤) AND (Übung)")
+    assert main.validate_query_syntax("(κακοήθεια) AND (θεραπεία)")
+    assert not main.validate_query_syntax(")癌症 OR 肿瘤(")
+    assert not main.validate_query_syntax("(κακοήθεια)) AND ((θεραπεία)")
+
+
+# ============================================================================
+# MAIN TEST EXECUTION
+# ============================================================================
+
+if __name__ == '__main__':
+    exit(run_tests(globals()))